@@ -17,6 +17,7 @@ logger = logging.getLogger("chipmate.auth.jwt")
 
 ALGORITHM = "HS256"
 DEFAULT_EXPIRE_HOURS = 24
+_DEFAULT_EXPIRE_DELTA = timedelta(hours=DEFAULT_EXPIRE_HOURS)
 
 
 def create_access_token(
@@ -34,7 +35,7 @@ def create_access_token(
     """
     to_encode = data.copy()
     now = datetime.now(timezone.utc)
-    expire = now + (expires_delta or timedelta(hours=DEFAULT_EXPIRE_HOURS))
+    expire = now + (expires_delta or _DEFAULT_EXPIRE_DELTA)
 
     to_encode.update({"exp": expire, "iat": now})
     token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGORITHM)
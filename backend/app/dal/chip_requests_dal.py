@@ -18,6 +18,48 @@ logger = logging.getLogger("chipmate.dal.chip_requests")
 
 COLLECTION = "chip_requests"
 
+# Requests whose amount counts toward a player's buy-ins.
+_RESOLVED_STATUSES = [str(RequestStatus.APPROVED), str(RequestStatus.EDITED)]
+
+# Mirrors ``ChipRequest.effective_amount`` for resolved requests:
+# ``edited_amount`` for EDITED requests, ``amount`` otherwise.
+_EFFECTIVE_AMOUNT = {
+    "$cond": [
+        {"$eq": ["$status", str(RequestStatus.EDITED)]},
+        "$edited_amount",
+        "$amount",
+    ]
+}
+
+
+def _to_cash_credit_totals(by_type: dict[str, int]) -> dict[str, int]:
+    """Fold per-type buy-in sums into cash and credit totals.
+
+    Every non-CASH request type counts as credit.
+    """
+    total_cash_in = by_type.pop(str(RequestType.CASH), 0)
+    return {
+        "total_cash_in": total_cash_in,
+        "total_credit_in": sum(by_type.values()),
+    }
+
+
+def _buy_in_totals_pipeline(match: dict, group_id: object) -> list[dict]:
+    """Build an aggregation summing effective buy-in amounts.
+
+    Args:
+        match: Extra ``$match`` conditions (game, player) on top of the
+            resolved-status filter.
+        group_id: The ``$group`` ``_id`` expression to total by.
+
+    Returns:
+        The aggregation pipeline.
+    """
+    return [
+        {"$match": {**match, "status": {"$in": _RESOLVED_STATUSES}}},
+        {"$group": {"_id": group_id, "total": {"$sum": _EFFECTIVE_AMOUNT}}},
+    ]
+
 
 class ChipRequestDAL:
     """Data access layer for the chip_requests collection."""
@@ -41,7 +83,7 @@ class ChipRequestDAL:
         doc = chip_request.to_mongo_dict()
         result = await self._collection.insert_one(doc)
         chip_request.id = str(result.inserted_id)
-        logger.info(
+        logger.debug(
             "Created chip request %s for player_token=%s in game=%s (type=%s, amount=%d)",
             chip_request.id,
             chip_request.player_token,
@@ -170,6 +212,64 @@ class ChipRequestDAL:
             requests.append(ChipRequest(**doc))
         return requests
 
+    async def get_buy_in_totals(
+        self, game_id: str, player_token: str
+    ) -> dict[str, int]:
+        """Sum a player's resolved cash and credit buy-ins in one aggregation.
+
+        Mirrors ``ChipRequest.effective_amount``: APPROVED requests count
+        their ``amount``, EDITED requests their ``edited_amount``, and
+        PENDING/DECLINED requests are excluded. Uses the
+        ``idx_game_player_created`` index for the ``$match`` stage.
+
+        Args:
+            game_id: String representation of the game's ObjectId.
+            player_token: The player's UUID token.
+
+        Returns:
+            A dict with ``total_cash_in`` and ``total_credit_in`` (0 when
+            the player has no resolved requests).
+        """
+        cursor = self._collection.aggregate(_buy_in_totals_pipeline(
+            {"game_id": game_id, "player_token": player_token},
+            "$request_type",
+        ))
+        by_type: dict[str, int] = {}
+        async for doc in cursor:
+            by_type[doc["_id"]] = doc["total"]
+        return _to_cash_credit_totals(by_type)
+
+    async def get_buy_in_totals_by_player(
+        self, game_id: str
+    ) -> dict[str, dict[str, int]]:
+        """Sum resolved cash and credit buy-ins for every player in a game.
+
+        Game-wide form of ``get_buy_in_totals``: one aggregation instead
+        of one per player. Uses the ``idx_game_status_created`` index for
+        the ``$match`` stage.
+
+        Args:
+            game_id: String representation of the game's ObjectId.
+
+        Returns:
+            A dict mapping player_token to ``total_cash_in`` and
+            ``total_credit_in``. Players with no resolved requests are
+            absent.
+        """
+        cursor = self._collection.aggregate(_buy_in_totals_pipeline(
+            {"game_id": game_id},
+            {"player_token": "$player_token", "request_type": "$request_type"},
+        ))
+        by_player: dict[str, dict[str, int]] = {}
+        async for doc in cursor:
+            key = doc["_id"]
+            by_player.setdefault(key["player_token"], {})[key["request_type"]] = doc["total"]
+
+        return {
+            player_token: _to_cash_credit_totals(by_type)
+            for player_token, by_type in by_player.items()
+        }
+
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
@@ -42,7 +42,7 @@ class GameDAL:
         doc = game.to_mongo_dict()
         result = await self._collection.insert_one(doc)
         game.id = str(result.inserted_id)
-        logger.info("Created game %s with code %s", game.id, game.code)
+        logger.debug("Created game %s with code %s", game.id, game.code)
         return game
 
     # ------------------------------------------------------------------
@@ -86,6 +86,24 @@ class GameDAL:
         doc["_id"] = str(doc["_id"])
         return Game(**doc)
 
+    async def code_in_use(self, code: str) -> bool:
+        """Check whether an active game already holds a join code.
+
+        Same filter as ``get_by_code`` but only the ``_id`` is projected,
+        so no Game model is built.
+
+        Args:
+            code: The 6-character uppercase game code.
+
+        Returns:
+            True if an OPEN or SETTLING game uses the code.
+        """
+        doc = await self._collection.find_one(
+            {"code": code, "status": {"$in": ["OPEN", "SETTLING"]}},
+            {"_id": 1},
+        )
+        return doc is not None
+
     async def list_by_status(
         self,
         status: GameStatus,
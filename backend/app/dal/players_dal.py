@@ -40,7 +40,7 @@ class PlayerDAL:
         doc = player.to_mongo_dict()
         result = await self._collection.insert_one(doc)
         player.id = str(result.inserted_id)
-        logger.info(
+        logger.debug(
             "Created player %s (display_name=%s) in game %s",
             player.id,
             player.display_name,
@@ -139,6 +139,33 @@ class PlayerDAL:
             players.append(Player(**doc))
         return players
 
+    async def get_distributions_crediting(
+        self, game_id: str, debtor_token: str
+    ) -> list[dict[str, Any]]:
+        """List active players whose distribution includes credit from a debtor.
+
+        Only ``player_token`` and ``distribution.credit_from`` are projected,
+        so no Player models are built for what is a read-only scan.
+
+        Args:
+            game_id: String representation of the game's ObjectId.
+            debtor_token: The player_token of the debtor.
+
+        Returns:
+            Raw documents with ``player_token`` and ``distribution.credit_from``,
+            in join order.
+        """
+        cursor = self._collection.find(
+            {
+                "game_id": game_id,
+                "is_active": True,
+                "player_token": {"$ne": debtor_token},
+                "distribution.credit_from.from": debtor_token,
+            },
+            {"_id": 0, "player_token": 1, "distribution.credit_from": 1},
+        ).sort("joined_at", 1)
+        return [doc async for doc in cursor]
+
     async def count_all(self) -> int:
         """Count all players in the collection.
 
@@ -147,6 +174,17 @@ class PlayerDAL:
         """
         return await self._collection.count_documents({})
 
+    async def count_by_game(self, game_id: str) -> int:
+        """Count all players in a game, including inactive ones.
+
+        Args:
+            game_id: String representation of the game's ObjectId.
+
+        Returns:
+            The number of player documents for the game.
+        """
+        return await self._collection.count_documents({"game_id": game_id})
+
     async def get_checked_out_count(self, game_id: str) -> int:
         """Count how many players in a game have been checked out.
 
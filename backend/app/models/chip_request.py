@@ -4,12 +4,12 @@ Based on T2 MongoDB schema: chip_requests collection.
 Represents a buy-in request (cash or credit) from a player.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_serializer, model_validator
 
-from app.models.common import PyObjectId, RequestStatus, RequestType
+from app.models.common import PyObjectId, RequestStatus, RequestType, utcnow
 
 
 class ChipRequest(BaseModel):
@@ -29,9 +29,7 @@ class ChipRequest(BaseModel):
     amount: int = Field(gt=0)
     status: RequestStatus = RequestStatus.PENDING
     edited_amount: Optional[int] = Field(default=None, gt=0)
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc)
-    )
+    created_at: datetime = Field(default_factory=utcnow)
     resolved_at: Optional[datetime] = None
     resolved_by: Optional[str] = None
 
@@ -1,5 +1,6 @@
 """Common enums, shared types, and utilities for ChipMate v2 models."""
 
+from datetime import datetime, timezone
 from enum import StrEnum
 from typing import Annotated, Any
 
@@ -18,6 +19,14 @@ def _validate_object_id(value: Any) -> str:
     raise ValueError(f"Invalid ObjectId value: {value}")
 
 
+def utcnow() -> datetime:
+    """Return the current timezone-aware UTC time.
+
+    Shared ``default_factory`` for model timestamp fields.
+    """
+    return datetime.now(timezone.utc)
+
+
 # Annotated type for MongoDB ObjectId fields.
 # Accepts ObjectId or string on input, always serializes as string.
 PyObjectId = Annotated[
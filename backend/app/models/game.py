@@ -3,12 +3,15 @@
 Based on T2 MongoDB schema: games collection with embedded bank sub-document.
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_serializer
 
-from app.models.common import GameStatus, PyObjectId
+from app.models.common import GameStatus, PyObjectId, utcnow
+
+# How long a game stays OPEN before the expiry task auto-closes it.
+GAME_TTL = timedelta(hours=24)
 
 
 class Bank(BaseModel):
@@ -41,13 +44,9 @@ class Game(BaseModel):
     code: str
     status: GameStatus = GameStatus.OPEN
     manager_player_token: str
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc)
-    )
+    created_at: datetime = Field(default_factory=utcnow)
     closed_at: Optional[datetime] = None
-    expires_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc) + timedelta(hours=24)
-    )
+    expires_at: datetime = Field(default_factory=lambda: utcnow() + GAME_TTL)
     bank: Bank = Field(default_factory=Bank)
 
     # -- Settlement state fields --
@@ -4,12 +4,12 @@ Based on T2 MongoDB schema: notifications collection.
 Poll-based notifications for players, auto-deleted after 48 hours via TTL index.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_serializer
 
-from app.models.common import NotificationType, PyObjectId
+from app.models.common import NotificationType, PyObjectId, utcnow
 
 
 class Notification(BaseModel):
@@ -29,9 +29,7 @@ class Notification(BaseModel):
     message: str
     related_id: Optional[str] = None
     is_read: bool = False
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc)
-    )
+    created_at: datetime = Field(default_factory=utcnow)
 
     @field_serializer("id")
     def serialize_id(self, value: Optional[str], _info) -> Optional[str]:
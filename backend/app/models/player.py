@@ -4,12 +4,12 @@ Based on T2 MongoDB schema: players collection.
 One document per player per game, identified by UUID player_token.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_serializer
 
-from app.models.common import CheckoutStatus, PyObjectId
+from app.models.common import CheckoutStatus, PyObjectId, utcnow
 
 
 class Player(BaseModel):
@@ -31,9 +31,7 @@ class Player(BaseModel):
     checked_out: bool = False
     final_chip_count: Optional[int] = None
     profit_loss: Optional[int] = None
-    joined_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc)
-    )
+    joined_at: datetime = Field(default_factory=utcnow)
     checked_out_at: Optional[datetime] = None
 
     # -- Checkout state machine fields --
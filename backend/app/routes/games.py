@@ -364,19 +364,9 @@ async def get_player_me(
     # Compute buy-in totals
     db = get_database()
     chip_request_dal = ChipRequestDAL(db)
-    requests = await chip_request_dal.get_by_player(
-        game_id, player.player_token, limit=10000
-    )
-    total_cash_in = 0
-    total_credit_in = 0
-    for req in requests:
-        amount = req.effective_amount
-        if amount <= 0:
-            continue
-        if str(req.request_type) == "CASH":
-            total_cash_in += amount
-        else:
-            total_credit_in += amount
+    totals = await chip_request_dal.get_buy_in_totals(game_id, player.player_token)
+    total_cash_in = totals["total_cash_in"]
+    total_credit_in = totals["total_credit_in"]
 
     total_buy_in = total_cash_in + total_credit_in
     current_chips = (
@@ -65,9 +65,7 @@ class AdminService:
         results: list[dict[str, Any]] = []
         for game in games:
             game_id = str(game.id)
-            players = await self._player_dal.get_by_game(
-                game_id, include_inactive=True
-            )
+            player_count = await self._player_dal.count_by_game(game_id)
             created_at_str = (
                 game.created_at.isoformat()
                 if hasattr(game.created_at, "isoformat")
@@ -77,7 +75,7 @@ class AdminService:
                 "game_id": game_id,
                 "game_code": game.code,
                 "status": str(game.status),
-                "player_count": len(players),
+                "player_count": player_count,
                 "bank": {
                     "cash_balance": game.bank.cash_balance,
                     "total_cash_in": game.bank.total_cash_in,
@@ -70,6 +70,7 @@ def compute_distribution_suggestion(
         if p["preferred_credit"] > 0 and p["chips_after_credit"] > 0
     ]
     credit_requesters.sort(key=lambda p: p["preferred_credit"], reverse=True)
+    requester_tokens = {r["player_token"] for r in credit_requesters}
 
     remaining_credit_pool = credit_pool
 
@@ -78,18 +79,19 @@ def compute_distribution_suggestion(
         wanted = requester["preferred_credit"]
         assigned = 0
 
-        sorted_debtors = sorted(
-            debtor_remaining.items(), key=lambda x: x[1], reverse=True
+        # Only debtors with credit left can be drawn from; once the request
+        # is filled or the pool is empty, no later debtor can transfer.
+        credit_from = result[token]["credit_from"]
+        open_debtors = sorted(
+            ((t, amt) for t, amt in debtor_remaining.items() if amt > 0),
+            key=lambda x: x[1],
+            reverse=True,
         )
-        for debtor_token, debtor_amt in sorted_debtors:
-            if assigned >= wanted or debtor_amt <= 0:
-                continue
+        for debtor_token, debtor_amt in open_debtors:
             transfer = min(wanted - assigned, debtor_amt, remaining_credit_pool)
             if transfer <= 0:
-                continue
-            result[token]["credit_from"].append(
-                {"from": debtor_token, "amount": transfer}
-            )
+                break
+            credit_from.append({"from": debtor_token, "amount": transfer})
             debtor_remaining[debtor_token] -= transfer
             remaining_credit_pool -= transfer
             assigned += transfer
@@ -99,7 +101,7 @@ def compute_distribution_suggestion(
 
     for p in players:
         token = p["player_token"]
-        if token in [r["player_token"] for r in credit_requesters]:
+        if token in requester_tokens:
             continue
         result[token]["cash"] = p["chips_after_credit"]
 
@@ -7,7 +7,7 @@ status/bankroll summary. Sits between route handlers and the DAL.
 import logging
 import random
 import string
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import HTTPException, status
@@ -17,9 +17,8 @@ from app.dal.games_dal import GameDAL
 from app.dal.players_dal import PlayerDAL
 from app.dal.chip_requests_dal import ChipRequestDAL
 from app.models.common import GameStatus
-from app.models.game import Game
+from app.models.game import GAME_TTL, Game
 from app.models.player import Player
-from app.models.common import RequestType
 
 logger = logging.getLogger("chipmate.services.game")
 
@@ -57,28 +56,6 @@ class GameService:
             )
         return manager
 
-    async def _compute_player_totals(self, game_id: str, player_token: str) -> dict[str, int]:
-        """Compute total cash/credit buy-ins for a player from approved/edited requests."""
-        requests = await self._chip_request_dal.get_by_player(
-            game_id, player_token, limit=10000
-        )
-        total_cash_in = 0
-        total_credit_in = 0
-
-        for req in requests:
-            amount = req.effective_amount
-            if amount <= 0:
-                continue
-            if req.request_type == RequestType.CASH:
-                total_cash_in += amount
-            else:
-                total_credit_in += amount
-
-        return {
-            "total_cash_in": total_cash_in,
-            "total_credit_in": total_credit_in,
-        }
-
     # ------------------------------------------------------------------
     # Game code generation
     # ------------------------------------------------------------------
@@ -98,8 +75,7 @@ class GameService:
         """
         for attempt in range(_MAX_CODE_RETRIES):
             code = "".join(random.choices(_CODE_CHARS, k=_CODE_LENGTH))
-            existing = await self._game_dal.get_by_code(code)
-            if existing is None:
+            if not await self._game_dal.code_in_use(code):
                 return code
             logger.warning(
                 "Game code collision on attempt %d: %s", attempt + 1, code
@@ -134,7 +110,7 @@ class GameService:
             status=GameStatus.OPEN,
             manager_player_token=manager_token,
             created_at=now,
-            expires_at=now + timedelta(hours=24),
+            expires_at=now + GAME_TTL,
         )
 
         game = await self._game_dal.create(game)
@@ -287,9 +263,15 @@ class GameService:
         await self._require_manager_player(game_id, game.manager_player_token)
         players = await self._player_dal.get_by_game(game_id, include_inactive=True)
 
+        game_totals = await self._chip_request_dal.get_buy_in_totals_by_player(
+            game_id
+        )
+
         summaries: list[dict[str, Any]] = []
         for p in players:
-            totals = await self._compute_player_totals(game_id, p.player_token)
+            totals = game_totals.get(
+                p.player_token, {"total_cash_in": 0, "total_credit_in": 0}
+            )
             total_buy_in = totals["total_cash_in"] + totals["total_credit_in"]
             current_chips = (
                 p.final_chip_count
@@ -389,7 +371,9 @@ class GameService:
                 detail="Player not found in this game",
             )
 
-        totals = await self._compute_player_totals(game_id, player.player_token)
+        totals = await self._chip_request_dal.get_buy_in_totals(
+            game_id, player.player_token
+        )
         total_buy_in = totals["total_cash_in"] + totals["total_credit_in"]
         current_chips = (
             player.final_chip_count
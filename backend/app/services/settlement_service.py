@@ -13,7 +13,7 @@ from app.dal.chip_requests_dal import ChipRequestDAL
 from app.dal.games_dal import GameDAL
 from app.dal.notifications_dal import NotificationDAL
 from app.dal.players_dal import PlayerDAL
-from app.models.common import CheckoutStatus, GameStatus, RequestType
+from app.models.common import CheckoutStatus, GameStatus
 from app.services.checkout_math import compute_credit_deduction, compute_distribution_suggestion
 
 logger = logging.getLogger("chipmate.services.settlement")
@@ -48,36 +48,6 @@ class SettlementService:
             )
         return game
 
-    async def _compute_player_totals(
-        self, game_id: str, player_token: str
-    ) -> dict[str, int]:
-        """Compute total cash/credit buy-ins for a player from approved/edited requests.
-
-        Uses the ChipRequest.effective_amount property which returns:
-        - amount for APPROVED requests
-        - edited_amount for EDITED requests
-        - 0 for PENDING/DECLINED requests
-        """
-        requests = await self._chip_request_dal.get_by_player(
-            game_id, player_token, limit=10000
-        )
-        total_cash_in = 0
-        total_credit_in = 0
-
-        for req in requests:
-            amount = req.effective_amount
-            if amount <= 0:
-                continue
-            if req.request_type == RequestType.CASH:
-                total_cash_in += amount
-            else:
-                total_credit_in += amount
-
-        return {
-            "total_cash_in": total_cash_in,
-            "total_credit_in": total_credit_in,
-        }
-
     # ------------------------------------------------------------------
     # Start settling
     # ------------------------------------------------------------------
@@ -109,10 +79,13 @@ class SettlementService:
         # Get all active players and freeze their buy-in data
         players = await self._player_dal.get_active_players(game_id)
         total_cash_pool = 0
+        game_totals = await self._chip_request_dal.get_buy_in_totals_by_player(
+            game_id
+        )
 
         for player in players:
-            totals = await self._compute_player_totals(
-                game_id, player.player_token
+            totals = game_totals.get(
+                player.player_token, {"total_cash_in": 0, "total_credit_in": 0}
             )
             cash_in = totals["total_cash_in"]
             credit_in = totals["total_credit_in"]
@@ -184,7 +157,9 @@ class SettlementService:
             )
 
         # Compute and freeze buy-in
-        totals = await self._compute_player_totals(game_id, player_token)
+        totals = await self._chip_request_dal.get_buy_in_totals(
+            game_id, player_token
+        )
         frozen = {
             "total_cash_in": totals["total_cash_in"],
             "total_credit_in": totals["total_credit_in"],
@@ -635,18 +610,17 @@ class SettlementService:
     async def _build_debtor_actions(
         self, game_id: str, player_token: str
     ) -> list[dict]:
-        """Build pay_credit actions for a debtor by scanning all distributions."""
-        players = await self._player_dal.get_by_game(game_id, include_inactive=False)
+        """Build pay_credit actions for a debtor from the creditors' distributions."""
+        creditors = await self._player_dal.get_distributions_crediting(
+            game_id, player_token
+        )
         actions: list[dict] = []
-        for p in players:
-            if p.player_token == player_token:
-                continue
-            dist = p.distribution or {"cash": 0, "credit_from": []}
-            for entry in dist.get("credit_from", []):
+        for doc in creditors:
+            for entry in doc["distribution"]["credit_from"]:
                 if entry["from"] == player_token:
                     actions.append({
                         "type": "pay_credit",
-                        "to": p.player_token,
+                        "to": doc["player_token"],
                         "amount": entry["amount"],
                     })
         return actions
@@ -6,6 +6,7 @@ and MongoDB interactions using mongomock-motor (no real MongoDB required).
 """
 
 import os
+from datetime import timedelta
 
 # Set required env vars before any app imports
 os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
@@ -14,8 +15,21 @@ os.environ["TESTING"] = "1"
 
 import pytest
 import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from mongomock_motor import AsyncMongoMockClient
 
+from app.auth import dependencies as auth_deps_module
+from app.auth.jwt import create_access_token
+from app.config import settings
+from app.dal import database as db_module
+from app.main import app
+from app.routes import admin as admin_route_module
+from app.routes import auth as auth_route_module
+from app.routes import chip_requests as chip_requests_route_module
+from app.routes import games as games_route_module
+from app.routes import notifications as notifications_route_module
+from app.routes import settlement as settlement_route_module
+
 
 @pytest.fixture
 def anyio_backend():
@@ -23,20 +37,56 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(scope="session")
+def admin_token() -> str:
+    """A valid admin JWT, signed once per session."""
+    return create_access_token(data={"sub": settings.ADMIN_USERNAME, "role": "admin"})
+
+
+@pytest.fixture(scope="session")
+def expired_admin_token() -> str:
+    """An expired admin JWT."""
+    return create_access_token(
+        data={"sub": settings.ADMIN_USERNAME, "role": "admin"},
+        expires_delta=timedelta(seconds=-1),
+    )
+
+
+@pytest.fixture(scope="session")
+def non_admin_token() -> str:
+    """A valid JWT without admin role."""
+    return create_access_token(data={"sub": "regular_user", "role": "player"})
+
+
+@pytest.fixture(scope="session")
+def mongo_client():
+    """One mongomock-motor client shared by the whole test session."""
+    client = AsyncMongoMockClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def session_db(mongo_client):
+    """The shared ``chipmate_test`` database, for session-scoped wiring."""
+    return mongo_client["chipmate_test"]
+
+
 @pytest_asyncio.fixture
-async def test_db():
+async def test_db(session_db):
     """In-memory MongoDB mock database for unit tests.
 
-    Uses mongomock-motor so no real MongoDB instance is needed.
-    The database is ephemeral -- it disappears after each test.
+    Uses mongomock-motor so no real MongoDB instance is needed. Every
+    collection is emptied with ``delete_many`` after the test, which keeps
+    the collections (and their registered indexes) alive and is cheaper
+    for mongomock than dropping and recreating the database.
 
     Yields:
         An AsyncIOMotorDatabase-compatible mock database instance.
     """
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
+    yield session_db
+    for name in await session_db.list_collection_names():
+        await session_db[name].delete_many({})
 
 
 @pytest_asyncio.fixture
@@ -46,9 +96,37 @@ async def client():
     Yields:
         AsyncClient: HTTPX async client with the FastAPI app.
     """
-    from httpx import ASGITransport, AsyncClient
-    from app.main import app
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
 
+@pytest_asyncio.fixture
+async def mock_db(test_db, monkeypatch):
+    """Provide the in-memory mock database and patch all get_database refs.
+
+    Every module that imported ``get_database`` by name is patched, so the
+    route, auth-dependency and DAL layers all see the same database.
+    """
+    getter = lambda: test_db
+    for module in (
+        db_module,
+        auth_deps_module,
+        admin_route_module,
+        auth_route_module,
+        chip_requests_route_module,
+        games_route_module,
+        notifications_route_module,
+        settlement_route_module,
+    ):
+        monkeypatch.setattr(module, "get_database", getter)
+
+    yield test_db
+
+
+@pytest_asyncio.fixture
+async def test_client(mock_db):
+    """Async HTTP client wired to the FastAPI app with mocked db."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
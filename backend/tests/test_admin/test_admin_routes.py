@@ -4,83 +4,28 @@ Tests the full HTTP stack using HTTPX AsyncClient with the FastAPI app
 and mongomock-motor (no real MongoDB required).
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
-
-from app.auth.jwt import create_access_token
-from app.dal import database as db_module
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
-from app.routes import chip_requests as chip_requests_route_module
-from app.routes import notifications as notifications_route_module
-from app.routes import admin as admin_route_module
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _admin_token() -> str:
-    """Create a valid admin JWT for testing."""
-    return create_access_token(data={"sub": "admin", "role": "admin"})
 
 
-def _admin_headers() -> dict[str, str]:
-    """Return Authorization header with a valid admin JWT."""
-    return {"Authorization": f"Bearer {_admin_token()}"}
+# Fields every entry in the admin games list must carry.
+GAME_SUMMARY_FIELDS = frozenset(
+    {"game_id", "game_code", "status", "player_count", "bank", "created_at"}
+)
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    getter = lambda: db
-    orig_db = db_module.get_database
-    orig_auth = auth_deps_module.get_database
-    orig_games = games_route_module.get_database
-    orig_requests = chip_requests_route_module.get_database
-    orig_notifications = notifications_route_module.get_database
-    orig_admin = admin_route_module.get_database
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-    chip_requests_route_module.get_database = getter
-    notifications_route_module.get_database = getter
-    admin_route_module.get_database = getter
-
-    yield db
+@pytest.fixture(scope="module")
+def admin_headers(admin_token) -> dict[str, str]:
+    """Authorization header carrying the shared admin JWT."""
+    return {"Authorization": f"Bearer {admin_token}"}
 
-    db_module.get_database = orig_db
-    auth_deps_module.get_database = orig_auth
-    games_route_module.get_database = orig_games
-    chip_requests_route_module.get_database = orig_requests
-    notifications_route_module.get_database = orig_notifications
-    admin_route_module.get_database = orig_admin
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
 async def _create_game(test_client, manager_name="Alice"):
     """Helper to create a game via the API."""
@@ -98,43 +43,68 @@ async def _join_game(test_client, game_id, player_name):
     return resp.json()
 
 
+# ---------------------------------------------------------------------------
+# Admin JWT requirement -- every admin endpoint
+# ---------------------------------------------------------------------------
+
+class TestAdminAuthRequired:
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("GET", "/api/admin/games"),
+            ("GET", "/api/admin/games/{game_id}"),
+            ("POST", "/api/admin/games/{game_id}/force-close"),
+            ("GET", "/api/admin/stats"),
+        ],
+    )
+    async def test_requires_admin_jwt(self, test_client, method, path):
+        """Admin endpoints without auth return 401."""
+        game = await _create_game(test_client, "Alice")
+        resp = await test_client.request(
+            method, path.format(game_id=game["game_id"])
+        )
+        assert resp.status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # GET /api/admin/games -- List all games
 # ---------------------------------------------------------------------------
 
 class TestListGames:
 
-    @pytest.mark.asyncio
-    async def test_list_games_empty(self, test_client):
+    async def test_list_games_empty(self, test_client, admin_headers):
         """List games returns empty list when no games exist."""
-        resp = await test_client.get("/api/admin/games", headers=_admin_headers())
+        resp = await test_client.get("/api/admin/games", headers=admin_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["games"] == []
         assert data["total"] == 0
 
-    @pytest.mark.asyncio
-    async def test_list_games_returns_games(self, test_client):
+    async def test_list_games_returns_games(self, test_client, admin_headers):
         """List games returns created games."""
         await _create_game(test_client, "Alice")
         await _create_game(test_client, "Bob")
 
-        resp = await test_client.get("/api/admin/games", headers=_admin_headers())
+        resp = await test_client.get("/api/admin/games", headers=admin_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["total"] == 2
         assert len(data["games"]) == 2
         # Each game should have expected fields
-        game = data["games"][0]
-        assert "game_id" in game
-        assert "game_code" in game
-        assert "status" in game
-        assert "player_count" in game
-        assert "bank" in game
-        assert "created_at" in game
-
-    @pytest.mark.asyncio
-    async def test_list_games_filter_by_status(self, test_client):
+        assert GAME_SUMMARY_FIELDS <= data["games"][0].keys()
+
+    async def test_list_games_player_count(self, test_client, admin_headers):
+        """player_count counts the manager plus every joined player."""
+        game = await _create_game(test_client, "Alice")
+        await _join_game(test_client, game["game_id"], "Bob")
+        await _join_game(test_client, game["game_id"], "Charlie")
+
+        resp = await test_client.get("/api/admin/games", headers=admin_headers)
+        assert resp.status_code == 200
+        assert resp.json()["games"][0]["player_count"] == 3
+
+    async def test_list_games_filter_by_status(self, test_client, admin_headers):
         """List games with status filter returns only matching games."""
         game1 = await _create_game(test_client, "Alice")
         await _create_game(test_client, "Bob")
@@ -142,12 +112,12 @@ class TestListGames:
         # Force close game1
         await test_client.post(
             f"/api/admin/games/{game1['game_id']}/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
 
         # Filter for OPEN games only
         resp = await test_client.get(
-            "/api/admin/games", params={"status": "OPEN"}, headers=_admin_headers()
+            "/api/admin/games", params={"status": "OPEN"}, headers=admin_headers
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -156,21 +126,14 @@ class TestListGames:
 
         # Filter for CLOSED games only
         resp = await test_client.get(
-            "/api/admin/games", params={"status": "CLOSED"}, headers=_admin_headers()
+            "/api/admin/games", params={"status": "CLOSED"}, headers=admin_headers
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["total"] == 1
         assert data["games"][0]["status"] == "CLOSED"
 
-    @pytest.mark.asyncio
-    async def test_list_games_requires_admin_jwt(self, test_client):
-        """List games without auth returns 401."""
-        resp = await test_client.get("/api/admin/games")
-        assert resp.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_list_games_pagination(self, test_client):
+    async def test_list_games_pagination(self, test_client, admin_headers):
         """List games respects limit and offset."""
         await _create_game(test_client, "Alice")
         await _create_game(test_client, "Bob")
@@ -179,7 +142,7 @@ class TestListGames:
         resp = await test_client.get(
             "/api/admin/games",
             params={"limit": 2, "offset": 0},
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp.status_code == 200
         assert len(resp.json()["games"]) == 2
@@ -187,7 +150,7 @@ class TestListGames:
         resp = await test_client.get(
             "/api/admin/games",
             params={"limit": 2, "offset": 2},
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp.status_code == 200
         assert len(resp.json()["games"]) == 1
@@ -199,14 +162,13 @@ class TestListGames:
 
 class TestGetGameDetail:
 
-    @pytest.mark.asyncio
-    async def test_game_detail_returns_full_info(self, test_client):
+    async def test_game_detail_returns_full_info(self, test_client, admin_headers):
         """Get game detail returns game, players, and request stats."""
         game = await _create_game(test_client, "Alice")
         await _join_game(test_client, game["game_id"], "Bob")
 
         resp = await test_client.get(
-            f"/api/admin/games/{game['game_id']}", headers=_admin_headers()
+            f"/api/admin/games/{game['game_id']}", headers=admin_headers
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -229,22 +191,14 @@ class TestGetGameDetail:
         assert data["request_stats"]["pending"] == 0
         assert data["request_stats"]["approved"] == 0
 
-    @pytest.mark.asyncio
-    async def test_game_detail_nonexistent_returns_404(self, test_client):
+    async def test_game_detail_nonexistent_returns_404(self, test_client, admin_headers):
         """Get game detail for nonexistent game returns 404."""
         resp = await test_client.get(
             "/api/admin/games/000000000000000000000000",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_game_detail_requires_admin_jwt(self, test_client):
-        """Get game detail without auth returns 401."""
-        game = await _create_game(test_client, "Alice")
-        resp = await test_client.get(f"/api/admin/games/{game['game_id']}")
-        assert resp.status_code == 401
-
 
 # ---------------------------------------------------------------------------
 # POST /api/admin/games/{game_id}/force-close -- Force close a game
@@ -252,14 +206,13 @@ class TestGetGameDetail:
 
 class TestForceCloseGame:
 
-    @pytest.mark.asyncio
-    async def test_force_close_changes_status(self, test_client):
+    async def test_force_close_changes_status(self, test_client, admin_headers):
         """Force close sets game status to CLOSED."""
         game = await _create_game(test_client, "Alice")
 
         resp = await test_client.post(
             f"/api/admin/games/{game['game_id']}/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -269,48 +222,37 @@ class TestForceCloseGame:
 
         # Verify via detail endpoint
         detail_resp = await test_client.get(
-            f"/api/admin/games/{game['game_id']}", headers=_admin_headers()
+            f"/api/admin/games/{game['game_id']}", headers=admin_headers
         )
         assert detail_resp.json()["game"]["status"] == "CLOSED"
 
-    @pytest.mark.asyncio
-    async def test_force_close_already_closed_succeeds(self, test_client):
+    async def test_force_close_already_closed_succeeds(self, test_client, admin_headers):
         """Force closing an already closed game still succeeds."""
         game = await _create_game(test_client, "Alice")
 
         # Close first time
         resp1 = await test_client.post(
             f"/api/admin/games/{game['game_id']}/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp1.status_code == 200
 
         # Close again -- should still succeed
         resp2 = await test_client.post(
             f"/api/admin/games/{game['game_id']}/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp2.status_code == 200
         assert resp2.json()["status"] == "CLOSED"
 
-    @pytest.mark.asyncio
-    async def test_force_close_nonexistent_returns_404(self, test_client):
+    async def test_force_close_nonexistent_returns_404(self, test_client, admin_headers):
         """Force close nonexistent game returns 404."""
         resp = await test_client.post(
             "/api/admin/games/000000000000000000000000/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_force_close_requires_admin_jwt(self, test_client):
-        """Force close without auth returns 401."""
-        game = await _create_game(test_client, "Alice")
-        resp = await test_client.post(
-            f"/api/admin/games/{game['game_id']}/force-close"
-        )
-        assert resp.status_code == 401
-
 
 # ---------------------------------------------------------------------------
 # GET /api/admin/stats -- Dashboard statistics
@@ -318,8 +260,7 @@ class TestForceCloseGame:
 
 class TestDashboardStats:
 
-    @pytest.mark.asyncio
-    async def test_stats_returns_correct_counts(self, test_client):
+    async def test_stats_returns_correct_counts(self, test_client, admin_headers):
         """Dashboard stats returns correct game and player counts."""
         # Create 3 games
         game1 = await _create_game(test_client, "Alice")
@@ -333,10 +274,10 @@ class TestDashboardStats:
         # Force close game3
         await test_client.post(
             f"/api/admin/games/{game3['game_id']}/force-close",
-            headers=_admin_headers(),
+            headers=admin_headers,
         )
 
-        resp = await test_client.get("/api/admin/stats", headers=_admin_headers())
+        resp = await test_client.get("/api/admin/stats", headers=admin_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["total_games"] == 3
@@ -346,10 +287,9 @@ class TestDashboardStats:
         # 3 managers + 2 joined players = 5 total players
         assert data["total_players"] == 5
 
-    @pytest.mark.asyncio
-    async def test_stats_empty_database(self, test_client):
+    async def test_stats_empty_database(self, test_client, admin_headers):
         """Dashboard stats on empty database returns all zeros."""
-        resp = await test_client.get("/api/admin/stats", headers=_admin_headers())
+        resp = await test_client.get("/api/admin/stats", headers=admin_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["total_games"] == 0
@@ -357,9 +297,3 @@ class TestDashboardStats:
         assert data["settling_games"] == 0
         assert data["closed_games"] == 0
         assert data["total_players"] == 0
-
-    @pytest.mark.asyncio
-    async def test_stats_requires_admin_jwt(self, test_client):
-        """Dashboard stats without auth returns 401."""
-        resp = await test_client.get("/api/admin/stats")
-        assert resp.status_code == 401
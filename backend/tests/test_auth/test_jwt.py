@@ -1,15 +1,11 @@
 """Tests for JWT token creation and decoding."""
 
-import os
 import time
 from datetime import timedelta
 
 import pytest
 from jose import JWTError, jwt
 
-# Ensure test env var is set before app imports
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 from app.auth.jwt import ALGORITHM, create_access_token, decode_token
 from app.config import settings
 
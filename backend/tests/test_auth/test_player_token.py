@@ -1,10 +1,7 @@
 """Tests for player token generation and validation."""
 
-import os
 import uuid
 
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 from app.auth.player_token import generate_player_token, validate_player_token
 
 
@@ -4,65 +4,11 @@ Tests the GET /api/games/{game_id}/requests/history and
 GET /api/games/{game_id}/requests/{request_id} endpoints.
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
-
-from app.dal import database as db_module
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
-from app.routes import chip_requests as chip_requests_route_module
-from app.routes import notifications as notifications_route_module
-
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Helpers
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    getter = lambda: db
-    orig_db = db_module.get_database
-    orig_auth = auth_deps_module.get_database
-    orig_games = games_route_module.get_database
-    orig_requests = chip_requests_route_module.get_database
-    orig_notifications = notifications_route_module.get_database
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-    chip_requests_route_module.get_database = getter
-    notifications_route_module.get_database = getter
-
-    yield db
-
-    db_module.get_database = orig_db
-    auth_deps_module.get_database = orig_auth
-    games_route_module.get_database = orig_games
-    chip_requests_route_module.get_database = orig_requests
-    notifications_route_module.get_database = orig_notifications
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
 async def _create_game(test_client, manager_name="Alice"):
     resp = await test_client.post("/api/games", json={"manager_name": manager_name})
     assert resp.status_code == 201
@@ -95,7 +41,6 @@ async def _create_request(
 
 class TestGetRequestById:
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_returns_200(self, test_client):
         """Player can get details of a request by ID."""
         game = await _create_game(test_client)
@@ -115,7 +60,6 @@ class TestGetRequestById:
         assert data["amount"] == 100
         assert data["status"] == "PENDING"
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_includes_all_fields(self, test_client):
         """Verify response includes all expected fields."""
         game = await _create_game(test_client)
@@ -142,7 +86,6 @@ class TestGetRequestById:
         assert data["request_type"] == "CREDIT"
         assert data["amount"] == 200
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_manager_can_view(self, test_client):
         """Manager can view any request in the game."""
         game = await _create_game(test_client)
@@ -159,7 +102,6 @@ class TestGetRequestById:
         assert data["id"] == req["id"]
         assert data["player_name"] == "Bob"
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_not_found(self, test_client):
         """Returns 404 for non-existent request ID."""
         game = await _create_game(test_client)
@@ -171,7 +113,6 @@ class TestGetRequestById:
         )
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_wrong_game(self, test_client):
         """Returns 404 when request belongs to a different game."""
         game1 = await _create_game(test_client, "Alice")
@@ -187,7 +128,6 @@ class TestGetRequestById:
         )
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_request_by_id_without_auth(self, test_client):
         """Returns 401 without authentication."""
         game = await _create_game(test_client)
@@ -206,7 +146,6 @@ class TestGetRequestById:
 
 class TestGetRequestHistory:
 
-    @pytest.mark.asyncio
     async def test_history_manager_sees_all_requests(self, test_client):
         """Manager can see all requests from all players."""
         game = await _create_game(test_client)
@@ -228,7 +167,6 @@ class TestGetRequestHistory:
         data = resp.json()
         assert len(data) == 3
 
-    @pytest.mark.asyncio
     async def test_history_player_sees_only_own_requests(self, test_client):
         """Regular player sees only their own requests."""
         game = await _create_game(test_client)
@@ -251,7 +189,6 @@ class TestGetRequestHistory:
         for req in data:
             assert req["player_token"] == bob["player_token"]
 
-    @pytest.mark.asyncio
     async def test_history_includes_all_statuses(self, test_client):
         """History includes PENDING, APPROVED, DECLINED, and EDITED statuses."""
         game = await _create_game(test_client)
@@ -302,7 +239,6 @@ class TestGetRequestHistory:
         assert "EDITED" in statuses
         assert "PENDING" in statuses
 
-    @pytest.mark.asyncio
     async def test_history_sorted_newest_first(self, test_client):
         """History is sorted by created_at descending (newest first)."""
         game = await _create_game(test_client)
@@ -332,7 +268,6 @@ class TestGetRequestHistory:
         assert data[1]["amount"] == 200
         assert data[2]["amount"] == 100
 
-    @pytest.mark.asyncio
     async def test_history_includes_player_name(self, test_client):
         """History includes player_name field."""
         game = await _create_game(test_client)
@@ -350,7 +285,6 @@ class TestGetRequestHistory:
         assert len(data) == 1
         assert data[0]["player_name"] == "Bob"
 
-    @pytest.mark.asyncio
     async def test_history_includes_timestamps(self, test_client):
         """History includes created_at and resolved_at timestamps."""
         game = await _create_game(test_client)
@@ -375,7 +309,6 @@ class TestGetRequestHistory:
         assert data[0]["created_at"] is not None
         assert data[0]["resolved_at"] is not None
 
-    @pytest.mark.asyncio
     async def test_history_without_auth(self, test_client):
         """Returns 401 without authentication."""
         game = await _create_game(test_client)
@@ -385,7 +318,6 @@ class TestGetRequestHistory:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_history_empty_list(self, test_client):
         """Returns empty list when no requests exist."""
         game = await _create_game(test_client)
@@ -399,7 +331,6 @@ class TestGetRequestHistory:
         data = resp.json()
         assert data == []
 
-    @pytest.mark.asyncio
     async def test_history_game_not_found(self, test_client):
         """Returns 404 for non-existent game."""
         game = await _create_game(test_client)
@@ -4,72 +4,24 @@ Tests the full HTTP stack using HTTPX AsyncClient with the FastAPI app
 and mongomock-motor (no real MongoDB required).
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
+from datetime import datetime, timezone
 
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
+from httpx import AsyncClient
 
-from app.auth.jwt import create_access_token
 from app.auth.player_token import generate_player_token
-from app.config import settings
-from app.dal import database as db_module
 from app.dal.games_dal import GameDAL
 from app.dal.players_dal import PlayerDAL
-from app.models.common import GameStatus
+from app.models.chip_request import ChipRequest
+from app.models.common import GameStatus, RequestStatus, RequestType
 from app.models.player import Player
 from app.services.game_service import _CODE_CHARS
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
 
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Helpers
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    # Patch everywhere get_database is imported
-    getter = lambda: db
-    orig_db = db_module.get_database
-    orig_auth = auth_deps_module.get_database
-    orig_routes = games_route_module.get_database
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-
-    yield db
-
-    db_module.get_database = orig_db
-    auth_deps_module.get_database = orig_auth
-    games_route_module.get_database = orig_routes
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
-@pytest.fixture
-def admin_token() -> str:
-    """A valid admin JWT for test use."""
-    return create_access_token(data={"sub": settings.ADMIN_USERNAME, "role": "admin"})
-
-
 async def _create_game(test_client: AsyncClient, manager_name: str = "Alice") -> dict:
     """Helper to create a game and return the response dict."""
     resp = await test_client.post(
@@ -90,6 +42,25 @@ async def _join_game(test_client: AsyncClient, game_id: str, player_name: str) -
     return resp.json()
 
 
+async def _seed_requests(db, game_id: str, rows: list[tuple]) -> None:
+    """Insert chip requests in one batch.
+
+    Each row is ``(player_token, request_type, amount, status, edited_amount)``.
+    """
+    await db["chip_requests"].insert_many([
+        ChipRequest(
+            game_id=game_id,
+            player_token=token,
+            requested_by=token,
+            request_type=request_type,
+            amount=amount,
+            status=req_status,
+            edited_amount=edited_amount,
+        ).to_mongo_dict()
+        for token, request_type, amount, req_status, edited_amount in rows
+    ])
+
+
 # ---------------------------------------------------------------------------
 # POST /api/games -- Create game
 # ---------------------------------------------------------------------------
@@ -97,7 +68,6 @@ async def _join_game(test_client: AsyncClient, game_id: str, player_name: str) -
 class TestCreateGameRoute:
     """Tests for POST /api/games."""
 
-    @pytest.mark.asyncio
     async def test_create_game_returns_201(self, test_client: AsyncClient):
         resp = await test_client.post(
             "/api/games",
@@ -110,7 +80,6 @@ class TestCreateGameRoute:
         assert "player_token" in data
         assert data["manager_name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_game_code_format(self, test_client: AsyncClient):
         data = await _create_game(test_client)
         code = data["game_code"]
@@ -118,7 +87,6 @@ class TestCreateGameRoute:
         for ch in code:
             assert ch in _CODE_CHARS, f"Unexpected char '{ch}' in code"
 
-    @pytest.mark.asyncio
     async def test_game_code_excludes_ambiguous(self, test_client: AsyncClient):
         """Run several creations and verify no I, O, 0, or 1 appear."""
         ambiguous = set("IO01")
@@ -129,7 +97,6 @@ class TestCreateGameRoute:
                 f"Code '{data['game_code']}' has ambiguous chars"
             )
 
-    @pytest.mark.asyncio
     async def test_create_game_name_too_short(self, test_client: AsyncClient):
         resp = await test_client.post(
             "/api/games",
@@ -137,7 +104,6 @@ class TestCreateGameRoute:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_game_name_too_long(self, test_client: AsyncClient):
         resp = await test_client.post(
             "/api/games",
@@ -145,7 +111,6 @@ class TestCreateGameRoute:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_game_missing_name(self, test_client: AsyncClient):
         resp = await test_client.post("/api/games", json={})
         assert resp.status_code == 422
@@ -158,7 +123,6 @@ class TestCreateGameRoute:
 class TestGameCodeLookup:
     """Tests for GET /api/games/code/{game_code}."""
 
-    @pytest.mark.asyncio
     async def test_lookup_existing_game(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         code = data["game_code"]
@@ -173,12 +137,10 @@ class TestGameCodeLookup:
         assert lookup["manager_name"] == "Alice"
         assert lookup["player_count"] >= 1  # at least manager
 
-    @pytest.mark.asyncio
     async def test_lookup_nonexistent_code_returns_404(self, test_client: AsyncClient):
         resp = await test_client.get("/api/games/code/ZZZZZZ")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_lookup_settling_game_cannot_join(
         self, test_client: AsyncClient, mock_db
     ):
@@ -198,7 +160,6 @@ class TestGameCodeLookup:
 class TestJoinGameRoute:
     """Tests for POST /api/games/{game_id}/join."""
 
-    @pytest.mark.asyncio
     async def test_join_open_game(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
 
@@ -216,7 +177,6 @@ class TestJoinGameRoute:
         assert join_data["game"]["manager_name"] == "Alice"
         assert join_data["game"]["status"] == "OPEN"
 
-    @pytest.mark.asyncio
     async def test_join_settling_game_returns_400(
         self, test_client: AsyncClient, mock_db
     ):
@@ -230,12 +190,9 @@ class TestJoinGameRoute:
         )
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_join_closed_game_returns_400(
         self, test_client: AsyncClient, mock_db
     ):
-        from datetime import datetime, timezone
-
         data = await _create_game(test_client, "Alice")
         game_dal = GameDAL(mock_db)
         await game_dal.update_status(
@@ -250,7 +207,6 @@ class TestJoinGameRoute:
         )
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_join_nonexistent_game_returns_404(self, test_client: AsyncClient):
         resp = await test_client.post(
             "/api/games/000000000000000000000000/join",
@@ -258,7 +214,6 @@ class TestJoinGameRoute:
         )
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_join_name_too_short(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.post(
@@ -267,7 +222,6 @@ class TestJoinGameRoute:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_join_name_too_long(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.post(
@@ -284,7 +238,6 @@ class TestJoinGameRoute:
 class TestGetGameRoute:
     """Tests for GET /api/games/{game_id}."""
 
-    @pytest.mark.asyncio
     async def test_get_game_with_player_token(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(
@@ -296,7 +249,6 @@ class TestGetGameRoute:
         assert game_data["game_id"] == data["game_id"]
         assert game_data["status"] == "OPEN"
 
-    @pytest.mark.asyncio
     async def test_get_game_with_admin_token(
         self, test_client: AsyncClient, admin_token: str
     ):
@@ -307,7 +259,6 @@ class TestGetGameRoute:
         )
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_get_game_without_auth_returns_401(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(f"/api/games/{data['game_id']}")
@@ -321,7 +272,6 @@ class TestGetGameRoute:
 class TestListPlayersRoute:
     """Tests for GET /api/games/{game_id}/players."""
 
-    @pytest.mark.asyncio
     async def test_list_players_returns_all(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         await _join_game(test_client, data["game_id"], "Bob")
@@ -337,7 +287,6 @@ class TestListPlayersRoute:
         names = {p["name"] for p in result["players"]}
         assert names == {"Alice", "Bob", "Charlie"}
 
-    @pytest.mark.asyncio
     async def test_list_players_identifies_manager(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(
@@ -349,7 +298,34 @@ class TestListPlayersRoute:
         manager_count = sum(1 for p in players if p["is_manager"])
         assert manager_count == 1
 
-    @pytest.mark.asyncio
+    async def test_list_players_sums_buy_ins_per_player(
+        self, test_client: AsyncClient, mock_db
+    ):
+        data = await _create_game(test_client, "Alice")
+        game_id = data["game_id"]
+        alice = data["player_token"]
+        bob = (await _join_game(test_client, game_id, "Bob"))["player_token"]
+        await _join_game(test_client, game_id, "Charlie")
+
+        await _seed_requests(mock_db, game_id, [
+            (alice, RequestType.CASH, 100, RequestStatus.APPROVED, None),
+            (alice, RequestType.CASH, 80, RequestStatus.EDITED, 50),
+            (bob, RequestType.CREDIT, 200, RequestStatus.APPROVED, None),
+            (bob, RequestType.CASH, 500, RequestStatus.DECLINED, None),
+            (bob, RequestType.CASH, 300, RequestStatus.PENDING, None),
+        ])
+
+        resp = await test_client.get(
+            f"/api/games/{game_id}/players",
+            headers={"X-Player-Token": alice},
+        )
+        assert resp.status_code == 200
+        totals = {
+            p["name"]: (p["total_cash_in"], p["total_credit_in"])
+            for p in resp.json()["players"]
+        }
+        assert totals == {"Alice": (150, 0), "Bob": (0, 200), "Charlie": (0, 0)}
+
     async def test_list_players_without_auth_returns_401(
         self, test_client: AsyncClient
     ):
@@ -358,6 +334,39 @@ class TestListPlayersRoute:
         assert resp.status_code == 401
 
 
+# ---------------------------------------------------------------------------
+# GET /api/games/{game_id}/players/me -- Current player details
+# ---------------------------------------------------------------------------
+
+class TestPlayerMeRoute:
+    """Tests for GET /api/games/{game_id}/players/me."""
+
+    async def test_player_me_sums_resolved_buy_ins(
+        self, test_client: AsyncClient, mock_db
+    ):
+        data = await _create_game(test_client, "Alice")
+        game_id = data["game_id"]
+        token = data["player_token"]
+
+        await _seed_requests(mock_db, game_id, [
+            (token, RequestType.CASH, 100, RequestStatus.APPROVED, None),
+            (token, RequestType.CASH, 80, RequestStatus.EDITED, 50),
+            (token, RequestType.CREDIT, 200, RequestStatus.APPROVED, None),
+            (token, RequestType.CASH, 500, RequestStatus.DECLINED, None),
+            (token, RequestType.CREDIT, 300, RequestStatus.PENDING, None),
+        ])
+
+        resp = await test_client.get(
+            f"/api/games/{game_id}/players/me",
+            headers={"X-Player-Token": token},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["total_cash_in"] == 150
+        assert body["total_credit_in"] == 200
+        assert body["current_chips"] == 350
+
+
 # ---------------------------------------------------------------------------
 # GET /api/games/{game_id}/status -- Game status with bankroll
 # ---------------------------------------------------------------------------
@@ -365,7 +374,6 @@ class TestListPlayersRoute:
 class TestGameStatusRoute:
     """Tests for GET /api/games/{game_id}/status."""
 
-    @pytest.mark.asyncio
     async def test_status_returns_expected_structure(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(
@@ -379,7 +387,6 @@ class TestGameStatusRoute:
         assert "chips" in status_data
         assert status_data["game"]["status"] == "OPEN"
 
-    @pytest.mark.asyncio
     async def test_status_player_count(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         await _join_game(test_client, data["game_id"], "Bob")
@@ -391,7 +398,6 @@ class TestGameStatusRoute:
         assert resp.status_code == 200
         assert resp.json()["players"]["total"] == 2
 
-    @pytest.mark.asyncio
     async def test_status_bank_defaults(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(
@@ -403,7 +409,6 @@ class TestGameStatusRoute:
         assert chips["total_credit_in"] == 0
         assert chips["total_in_play"] == 0
 
-    @pytest.mark.asyncio
     async def test_status_without_auth_returns_401(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(f"/api/games/{data['game_id']}/status")
@@ -425,7 +430,6 @@ except ImportError:
 class TestQRCodeRoute:
     """Tests for GET /api/games/{game_code}/qr."""
 
-    @pytest.mark.asyncio
     async def test_qr_returns_png(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         code = data["game_code"]
@@ -436,12 +440,10 @@ class TestQRCodeRoute:
         # PNG files start with the magic bytes 0x89504E47
         assert resp.content[:4] == b"\x89PNG"
 
-    @pytest.mark.asyncio
     async def test_qr_nonexistent_code_returns_404(self, test_client: AsyncClient):
         resp = await test_client.get("/api/games/ZZZZZZ/qr")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_qr_response_is_non_empty(self, test_client: AsyncClient):
         data = await _create_game(test_client, "Alice")
         resp = await test_client.get(f"/api/games/{data['game_code']}/qr")
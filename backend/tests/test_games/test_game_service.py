@@ -7,13 +7,12 @@ Tests cover:
     - Game status / bankroll calculation
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
+import random
+from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
 from app.dal.chip_requests_dal import ChipRequestDAL
 from app.dal.games_dal import GameDAL
@@ -28,12 +27,9 @@ from app.services.game_service import GameService, _CODE_CHARS, _CODE_LENGTH
 # ---------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def mock_db():
+async def mock_db(test_db):
     """Provide an in-memory mock MongoDB database."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
+    yield test_db
 
 
 @pytest_asyncio.fixture
@@ -62,12 +58,10 @@ async def player_dal(mock_db) -> PlayerDAL:
 class TestGenerateGameCode:
     """Tests for GameService.generate_game_code."""
 
-    @pytest.mark.asyncio
     async def test_code_is_6_characters(self, service: GameService):
         code = await service.generate_game_code()
         assert len(code) == _CODE_LENGTH
 
-    @pytest.mark.asyncio
     async def test_code_uses_unambiguous_characters(self, service: GameService):
         """Code should only contain characters from the allowed set."""
         for _ in range(20):
@@ -77,7 +71,6 @@ class TestGenerateGameCode:
                     f"Character '{char}' not in allowed set"
                 )
 
-    @pytest.mark.asyncio
     async def test_code_excludes_ambiguous_characters(self, service: GameService):
         """Code must never contain I, O, 0, or 1."""
         ambiguous = set("IO01")
@@ -87,11 +80,25 @@ class TestGenerateGameCode:
                 f"Code '{code}' contains ambiguous characters"
             )
 
-    @pytest.mark.asyncio
     async def test_code_is_uppercase(self, service: GameService):
         code = await service.generate_game_code()
         assert code == code.upper()
 
+    async def test_code_retries_on_collision(
+        self, service: GameService, game_dal: GameDAL, monkeypatch
+    ):
+        """A code held by an active game is skipped for the next candidate."""
+        await game_dal.create(Game(code="AAAAAA", manager_player_token="tok"))
+        candidates = iter(["AAAAAA", "BBBBBB"])
+        # game_service draws from the shared random module, so this patches
+        # random.choices globally for the duration of the test.
+        monkeypatch.setattr(
+            random, "choices", lambda chars, k: list(next(candidates))
+        )
+
+        code = await service.generate_game_code()
+        assert code == "BBBBBB"
+
 
 # ---------------------------------------------------------------------------
 # Game creation
@@ -100,7 +107,6 @@ class TestGenerateGameCode:
 class TestCreateGame:
     """Tests for GameService.create_game."""
 
-    @pytest.mark.asyncio
     async def test_create_game_returns_expected_keys(self, service: GameService):
         result = await service.create_game(manager_name="Alice")
         assert "game_id" in result
@@ -108,7 +114,6 @@ class TestCreateGame:
         assert "player_token" in result
         assert "manager_name" in result
 
-    @pytest.mark.asyncio
     async def test_create_game_code_format(self, service: GameService):
         result = await service.create_game(manager_name="Alice")
         code = result["game_code"]
@@ -116,7 +121,6 @@ class TestCreateGame:
         for ch in code:
             assert ch in _CODE_CHARS
 
-    @pytest.mark.asyncio
     async def test_create_game_stores_game_in_db(
         self, service: GameService, game_dal: GameDAL
     ):
@@ -126,7 +130,6 @@ class TestCreateGame:
         assert game.code == result["game_code"]
         assert game.status == GameStatus.OPEN
 
-    @pytest.mark.asyncio
     async def test_create_game_stores_manager_player(
         self, service: GameService, player_dal: PlayerDAL
     ):
@@ -139,7 +142,6 @@ class TestCreateGame:
         assert player.is_manager is True
         assert player.is_active is True
 
-    @pytest.mark.asyncio
     async def test_create_game_sets_expires_at(
         self, service: GameService, game_dal: GameDAL
     ):
@@ -151,7 +153,6 @@ class TestCreateGame:
         # Allow a small tolerance for test execution time
         assert 23.9 * 3600 <= delta.total_seconds() <= 24.1 * 3600
 
-    @pytest.mark.asyncio
     async def test_create_game_manager_token_matches_game(
         self, service: GameService, game_dal: GameDAL
     ):
@@ -168,35 +169,26 @@ class TestCreateGame:
 class TestGetGame:
     """Tests for GameService.get_game and get_game_by_code."""
 
-    @pytest.mark.asyncio
     async def test_get_game_found(self, service: GameService):
         result = await service.create_game(manager_name="Alice")
         game = await service.get_game(result["game_id"])
         assert str(game.id) == result["game_id"]
 
-    @pytest.mark.asyncio
     async def test_get_game_not_found_raises_404(self, service: GameService):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.get_game("000000000000000000000000")
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_game_by_code_found(self, service: GameService):
         result = await service.create_game(manager_name="Alice")
         game = await service.get_game_by_code(result["game_code"])
         assert str(game.id) == result["game_id"]
 
-    @pytest.mark.asyncio
     async def test_get_game_by_code_not_found_raises_404(self, service: GameService):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.get_game_by_code("ZZZZZZ")
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_game_by_code_case_insensitive(self, service: GameService):
         result = await service.create_game(manager_name="Alice")
         code = result["game_code"]
@@ -211,7 +203,6 @@ class TestGetGame:
 class TestJoinGame:
     """Tests for GameService.join_game."""
 
-    @pytest.mark.asyncio
     async def test_join_open_game_succeeds(self, service: GameService):
         game_result = await service.create_game(manager_name="Alice")
         join_result = await service.join_game(
@@ -225,7 +216,6 @@ class TestJoinGame:
         assert join_result["game"]["manager_name"] == "Alice"
         assert join_result["game"]["status"] == "OPEN"
 
-    @pytest.mark.asyncio
     async def test_join_game_creates_player_record(
         self, service: GameService, player_dal: PlayerDAL
     ):
@@ -240,27 +230,21 @@ class TestJoinGame:
         assert player.display_name == "Bob"
         assert player.is_manager is False
 
-    @pytest.mark.asyncio
     async def test_join_settling_game_raises_400(
         self, service: GameService, game_dal: GameDAL
     ):
         game_result = await service.create_game(manager_name="Alice")
         await game_dal.update_status(game_result["game_id"], GameStatus.SETTLING)
 
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.join_game(
                 game_id=game_result["game_id"], player_name="Bob"
             )
         assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_join_closed_game_raises_400(
         self, service: GameService, game_dal: GameDAL
     ):
-        from datetime import datetime, timezone
-
         game_result = await service.create_game(manager_name="Alice")
         await game_dal.update_status(
             game_result["game_id"],
@@ -268,18 +252,13 @@ class TestJoinGame:
             closed_at=datetime.now(timezone.utc),
         )
 
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.join_game(
                 game_id=game_result["game_id"], player_name="Bob"
             )
         assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_join_nonexistent_game_raises_404(self, service: GameService):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.join_game(
                 game_id="000000000000000000000000", player_name="Bob"
@@ -294,7 +273,6 @@ class TestJoinGame:
 class TestGameStatus:
     """Tests for GameService.get_game_status."""
 
-    @pytest.mark.asyncio
     async def test_status_returns_expected_structure(self, service: GameService):
         game_result = await service.create_game(manager_name="Alice")
         status_data = await service.get_game_status(game_result["game_id"])
@@ -308,7 +286,6 @@ class TestGameStatus:
         assert status_data["players"]["total"] == 1  # manager
         assert status_data["players"]["active"] == 1
 
-    @pytest.mark.asyncio
     async def test_status_player_count_increases_on_join(
         self, service: GameService
     ):
@@ -320,7 +297,6 @@ class TestGameStatus:
         assert status_data["players"]["total"] == 3  # Alice + Bob + Charlie
         assert status_data["players"]["active"] == 3
 
-    @pytest.mark.asyncio
     async def test_status_bank_starts_at_zero(self, service: GameService):
         game_result = await service.create_game(manager_name="Alice")
         status_data = await service.get_game_status(game_result["game_id"])
@@ -337,7 +313,6 @@ class TestGameStatus:
 class TestGetGamePlayers:
     """Tests for GameService.get_game_players."""
 
-    @pytest.mark.asyncio
     async def test_returns_all_players(self, service: GameService):
         game_result = await service.create_game(manager_name="Alice")
         await service.join_game(game_result["game_id"], "Bob")
@@ -346,7 +321,6 @@ class TestGetGamePlayers:
         names = {p.display_name for p in players}
         assert names == {"Alice", "Bob"}
 
-    @pytest.mark.asyncio
     async def test_empty_game_has_only_manager(self, service: GameService):
         game_result = await service.create_game(manager_name="Alice")
         players = await service.get_game_players(game_result["game_id"])
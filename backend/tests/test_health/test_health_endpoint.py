@@ -1,70 +1,68 @@
 """Tests for the health check endpoint."""
 
-import pytest
-from unittest.mock import AsyncMock, patch
 from app.config import settings
+from app.routes import health as health_route_module
+
+
+class _FakeDB:
+    """Minimal stand-in for the motor database used by the health route."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self._error = error
+
+    async def command(self, name: str) -> dict:
+        if self._error is not None:
+            raise self._error
+        return {"ok": 1}
+
+
+def _db_not_initialized():
+    raise RuntimeError("Database not initialized")
 
 
-@pytest.mark.asyncio
 class TestHealthEndpoint:
     """Test the /health endpoint behavior."""
 
-    async def test_health_endpoint_returns_200_when_db_is_healthy(self, client):
+    async def test_health_endpoint_returns_200_when_db_is_healthy(self, client, monkeypatch):
         """Health check returns 200 OK when database is connected."""
-        # Mock successful database ping
-        with patch('app.routes.health.get_database') as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.command = AsyncMock(return_value={"ok": 1})
-            mock_get_db.return_value = mock_db
-
-            response = await client.get("/health")
+        monkeypatch.setattr(health_route_module, "get_database", lambda: _FakeDB())
+        response = await client.get("/health")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["version"] == settings.APP_VERSION
-            assert data["checks"]["database"] == "ok"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["version"] == settings.APP_VERSION
+        assert data["checks"]["database"] == "ok"
 
-    async def test_health_endpoint_returns_200_when_db_is_down(self, client):
+    async def test_health_endpoint_returns_200_when_db_is_down(self, client, monkeypatch):
         """Health check returns 200 OK even when database is down."""
-        # Mock database connection failure
-        with patch('app.routes.health.get_database') as mock_get_db:
-            mock_get_db.side_effect = RuntimeError("Database not initialized")
-
-            response = await client.get("/health")
+        monkeypatch.setattr(health_route_module, "get_database", _db_not_initialized)
+        response = await client.get("/health")
 
-            # Should still return 200, not 503
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "degraded"
-            assert data["checks"]["database"] == "down"
+        # Should still return 200, not 503
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["checks"]["database"] == "down"
 
-    async def test_health_endpoint_returns_200_when_db_ping_fails(self, client):
+    async def test_health_endpoint_returns_200_when_db_ping_fails(self, client, monkeypatch):
         """Health check returns 200 OK when database ping fails."""
-        # Mock database ping failure
-        with patch('app.routes.health.get_database') as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.command = AsyncMock(side_effect=Exception("Connection timeout"))
-            mock_get_db.return_value = mock_db
+        failing_db = _FakeDB(error=Exception("Connection timeout"))
+        monkeypatch.setattr(health_route_module, "get_database", lambda: failing_db)
+        response = await client.get("/health")
 
-            response = await client.get("/health")
+        # Should still return 200, not 503
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["checks"]["database"] == "down"
 
-            # Should still return 200, not 503
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "degraded"
-            assert data["checks"]["database"] == "down"
-
-    async def test_health_endpoint_at_api_prefix(self, client):
+    async def test_health_endpoint_at_api_prefix(self, client, monkeypatch):
         """Health check is also available at /api/health."""
-        with patch('app.routes.health.get_database') as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.command = AsyncMock(return_value={"ok": 1})
-            mock_get_db.return_value = mock_db
-
-            response = await client.get("/api/health")
+        monkeypatch.setattr(health_route_module, "get_database", lambda: _FakeDB())
+        response = await client.get("/api/health")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "status" in data
-            assert "version" in data
+        assert response.status_code == 200
+        data = response.json()
+        assert "status" in data
+        assert "version" in data
@@ -10,6 +10,48 @@ from app.models.chip_request import ChipRequest, ChipRequestResponse
 from app.models.common import RequestStatus, RequestType
 
 
+_RESOLVED = {"resolved_by": "manager-token", "resolved_at": datetime.now(timezone.utc)}
+
+# (overrides on a 100-chip CASH request, expected effective_amount)
+EFFECTIVE_AMOUNT_CASES = [
+    pytest.param({}, 0, id="pending"),
+    pytest.param({"status": RequestStatus.APPROVED, **_RESOLVED}, 100, id="approved"),
+    pytest.param({"status": RequestStatus.DECLINED, **_RESOLVED}, 0, id="declined"),
+    pytest.param(
+        {"status": RequestStatus.EDITED, "edited_amount": 150, **_RESOLVED},
+        150,
+        id="edited",
+    ),
+]
+
+# (overrides on a 100-chip CASH request, field named in the ValidationError)
+INVALID_CASES = [
+    pytest.param({"amount": 0}, "amount", id="zero_amount"),
+    pytest.param({"amount": -50}, "amount", id="negative_amount"),
+    pytest.param(
+        {"status": RequestStatus.EDITED}, "edited_amount", id="edited_without_edited_amount"
+    ),
+    pytest.param(
+        {"status": RequestStatus.EDITED, "edited_amount": 0},
+        "edited_amount",
+        id="edited_amount_not_positive",
+    ),
+]
+
+
+def _chip_request(**overrides) -> ChipRequest:
+    """Build a 100-chip CASH request, applying any field overrides."""
+    fields = {
+        "game_id": "game1",
+        "player_token": "token1",
+        "requested_by": "token1",
+        "request_type": RequestType.CASH,
+        "amount": 100,
+    }
+    fields.update(overrides)
+    return ChipRequest(**fields)
+
+
 class TestChipRequest:
     """Tests for the ChipRequest domain model."""
 
@@ -53,27 +95,6 @@ class TestChipRequest:
         )
         assert cr.request_type == RequestType.CASH
 
-    def test_chip_request_amount_must_be_positive(self):
-        with pytest.raises(ValidationError) as exc_info:
-            ChipRequest(
-                game_id="game1",
-                player_token="token1",
-                requested_by="token1",
-                request_type=RequestType.CASH,
-                amount=0,
-            )
-        assert "amount" in str(exc_info.value).lower() or "greater_than" in str(exc_info.value).lower()
-
-    def test_chip_request_negative_amount_rejected(self):
-        with pytest.raises(ValidationError):
-            ChipRequest(
-                game_id="game1",
-                player_token="token1",
-                requested_by="token1",
-                request_type=RequestType.CASH,
-                amount=-50,
-            )
-
     def test_chip_request_on_behalf_of(self):
         cr = ChipRequest(
             game_id="game1",
@@ -86,83 +107,18 @@ class TestChipRequest:
         assert cr.requested_by == "manager-token"
         assert cr.player_token != cr.requested_by
 
-    def test_chip_request_approved_status(self):
-        cr = ChipRequest(
-            game_id="game1",
-            player_token="token1",
-            requested_by="token1",
-            request_type=RequestType.CASH,
-            amount=100,
-            status=RequestStatus.APPROVED,
-            resolved_by="manager-token",
-            resolved_at=datetime.now(timezone.utc),
-        )
-        assert cr.status == RequestStatus.APPROVED
-        assert cr.effective_amount == 100
-
-    def test_chip_request_declined_effective_amount(self):
-        cr = ChipRequest(
-            game_id="game1",
-            player_token="token1",
-            requested_by="token1",
-            request_type=RequestType.CASH,
-            amount=100,
-            status=RequestStatus.DECLINED,
-            resolved_by="manager-token",
-            resolved_at=datetime.now(timezone.utc),
-        )
-        assert cr.effective_amount == 0
-
-    def test_chip_request_pending_effective_amount(self):
-        cr = ChipRequest(
-            game_id="game1",
-            player_token="token1",
-            requested_by="token1",
-            request_type=RequestType.CASH,
-            amount=100,
-        )
-        assert cr.effective_amount == 0
-
-    def test_chip_request_edited_status(self):
-        cr = ChipRequest(
-            game_id="game1",
-            player_token="token1",
-            requested_by="token1",
-            request_type=RequestType.CREDIT,
-            amount=200,
-            status=RequestStatus.EDITED,
-            edited_amount=150,
-            resolved_by="manager-token",
-            resolved_at=datetime.now(timezone.utc),
-        )
-        assert cr.status == RequestStatus.EDITED
-        assert cr.edited_amount == 150
-        assert cr.effective_amount == 150
+    @pytest.mark.parametrize("overrides,expected", EFFECTIVE_AMOUNT_CASES)
+    def test_chip_request_effective_amount(self, overrides, expected):
+        cr = _chip_request(**overrides)
+        for field, value in overrides.items():
+            assert getattr(cr, field) == value
+        assert cr.effective_amount == expected
 
-    def test_chip_request_edited_without_edited_amount_fails(self):
+    @pytest.mark.parametrize("overrides,field", INVALID_CASES)
+    def test_chip_request_invalid_rejected(self, overrides, field):
         with pytest.raises(ValidationError) as exc_info:
-            ChipRequest(
-                game_id="game1",
-                player_token="token1",
-                requested_by="token1",
-                request_type=RequestType.CASH,
-                amount=100,
-                status=RequestStatus.EDITED,
-                # edited_amount is missing
-            )
-        assert "edited_amount" in str(exc_info.value).lower()
-
-    def test_chip_request_edited_amount_must_be_positive(self):
-        with pytest.raises(ValidationError):
-            ChipRequest(
-                game_id="game1",
-                player_token="token1",
-                requested_by="token1",
-                request_type=RequestType.CASH,
-                amount=100,
-                status=RequestStatus.EDITED,
-                edited_amount=0,
-            )
+            _chip_request(**overrides)
+        assert field in str(exc_info.value).lower()
 
     def test_chip_request_with_objectid(self):
         oid = ObjectId()
@@ -10,6 +10,19 @@ from app.models.notification import Notification, NotificationResponse
 from app.models.common import NotificationType
 
 
+# Fields on top of game_id/player_token that must fail validation.
+INVALID_CASES = [
+    pytest.param(
+        {"notification_type": "INVALID_TYPE", "message": "This should fail."},
+        id="invalid_type",
+    ),
+    pytest.param({"message": "This should fail."}, id="missing_notification_type"),
+    pytest.param(
+        {"notification_type": NotificationType.GAME_CLOSED}, id="missing_message"
+    ),
+]
+
+
 class TestNotification:
     """Tests for the Notification domain model."""
 
@@ -29,24 +42,15 @@ class TestNotification:
         assert isinstance(n.created_at, datetime)
         assert n.id is None
 
-    def test_notification_all_types(self):
-        for ntype in NotificationType:
-            n = Notification(
-                game_id="game1",
-                player_token="token1",
-                notification_type=ntype,
-                message=f"Test message for {ntype}",
-            )
-            assert n.notification_type == ntype
-
-    def test_notification_invalid_type(self):
-        with pytest.raises(ValidationError):
-            Notification(
-                game_id="game1",
-                player_token="token1",
-                notification_type="INVALID_TYPE",
-                message="This should fail.",
-            )
+    @pytest.mark.parametrize("ntype", list(NotificationType))
+    def test_notification_all_types(self, ntype):
+        n = Notification(
+            game_id="game1",
+            player_token="token1",
+            notification_type=ntype,
+            message=f"Test message for {ntype}",
+        )
+        assert n.notification_type == ntype
 
     def test_notification_with_related_id(self):
         related = str(ObjectId())
@@ -119,23 +123,10 @@ class TestNotification:
         assert isinstance(data["created_at"], str)
         assert "2026-01-30" in data["created_at"]
 
-    def test_notification_missing_required_field(self):
-        with pytest.raises(ValidationError):
-            Notification(
-                game_id="game1",
-                player_token="token1",
-                # notification_type is missing
-                message="This should fail.",
-            )
-
-    def test_notification_message_required(self):
+    @pytest.mark.parametrize("fields", INVALID_CASES)
+    def test_notification_invalid_rejected(self, fields):
         with pytest.raises(ValidationError):
-            Notification(
-                game_id="game1",
-                player_token="token1",
-                notification_type=NotificationType.GAME_CLOSED,
-                # message is missing
-            )
+            Notification(game_id="game1", player_token="token1", **fields)
 
 
 class TestNotificationResponse:
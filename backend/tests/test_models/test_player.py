@@ -6,6 +6,7 @@ import pytest
 from bson import ObjectId
 from pydantic import ValidationError
 
+from app.models.common import CheckoutStatus
 from app.models.player import Player, PlayerResponse
 
 
@@ -31,14 +32,23 @@ class TestPlayer:
         assert player.checked_out_at is None
         assert player.id is None
 
-    def test_player_with_manager_flag(self):
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("is_manager", True),
+            ("credits_owed", 300),
+            ("is_active", False),
+            ("profit_loss", -200),
+        ],
+    )
+    def test_player_field_override(self, field, value):
         player = Player(
             game_id="game1",
             player_token="token1",
             display_name="Host",
-            is_manager=True,
+            **{field: value},
         )
-        assert player.is_manager is True
+        assert getattr(player, field) == value
 
     def test_player_with_objectid(self):
         oid = ObjectId()
@@ -66,24 +76,6 @@ class TestPlayer:
         assert player.final_chip_count == 750
         assert player.profit_loss == 250
 
-    def test_player_credits_owed(self):
-        player = Player(
-            game_id="game1",
-            player_token="token1",
-            display_name="Charlie",
-            credits_owed=300,
-        )
-        assert player.credits_owed == 300
-
-    def test_player_inactive(self):
-        player = Player(
-            game_id="game1",
-            player_token="token1",
-            display_name="Dave",
-            is_active=False,
-        )
-        assert player.is_active is False
-
     def test_player_to_mongo_dict_no_id(self):
         player = Player(
             game_id="game1",
@@ -121,14 +113,62 @@ class TestPlayer:
         assert "2026-01-30" in data["joined_at"]
         assert data["checked_out_at"] is None
 
-    def test_player_negative_profit_loss(self):
-        player = Player(
-            game_id="game1",
-            player_token="token1",
-            display_name="Henry",
-            profit_loss=-200,
+
+class TestPlayerCheckoutFields:
+    """Tests for the settlement checkout fields on the Player model."""
+
+    def test_checkout_status_enum_values(self):
+        assert CheckoutStatus.PENDING == "PENDING"
+        assert CheckoutStatus.SUBMITTED == "SUBMITTED"
+        assert CheckoutStatus.VALIDATED == "VALIDATED"
+        assert CheckoutStatus.CREDIT_DEDUCTED == "CREDIT_DEDUCTED"
+        assert CheckoutStatus.AWAITING_DISTRIBUTION == "AWAITING_DISTRIBUTION"
+        assert CheckoutStatus.DISTRIBUTED == "DISTRIBUTED"
+        assert CheckoutStatus.DONE == "DONE"
+
+    def test_player_has_checkout_fields(self):
+        p = Player(game_id="g1", player_token="t1", display_name="Alice")
+        assert p.checkout_status is None
+        assert p.submitted_chip_count is None
+        assert p.validated_chip_count is None
+        assert p.preferred_cash is None
+        assert p.preferred_credit is None
+        assert p.chips_after_credit is None
+        assert p.credit_repaid is None
+        assert p.distribution is None
+        assert p.actions is None
+        assert p.input_locked is False
+        assert p.frozen_buy_in is None
+
+    def test_player_checkout_fields_set(self):
+        p = Player(
+            game_id="g1",
+            player_token="t1",
+            display_name="Bob",
+            checkout_status=CheckoutStatus.SUBMITTED,
+            submitted_chip_count=200,
+            preferred_cash=150,
+            preferred_credit=50,
+            input_locked=False,
+            frozen_buy_in={"total_cash_in": 100, "total_credit_in": 100, "total_buy_in": 200},
+        )
+        assert p.checkout_status == CheckoutStatus.SUBMITTED
+        assert p.submitted_chip_count == 200
+        assert p.preferred_cash == 150
+        assert p.preferred_credit == 50
+        assert p.frozen_buy_in["total_buy_in"] == 200
+
+    def test_player_checkout_fields_in_mongo_dict(self):
+        p = Player(
+            game_id="g1",
+            player_token="t1",
+            display_name="Charlie",
+            checkout_status=CheckoutStatus.VALIDATED,
+            validated_chip_count=300,
         )
-        assert player.profit_loss == -200
+        doc = p.to_mongo_dict()
+        assert doc["checkout_status"] == "VALIDATED"
+        assert doc["validated_chip_count"] == 300
 
 
 class TestPlayerResponse:
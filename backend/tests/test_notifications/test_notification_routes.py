@@ -4,64 +4,6 @@ Tests the full HTTP stack using HTTPX AsyncClient with the FastAPI app
 and mongomock-motor (no real MongoDB required).
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
-
-from app.dal import database as db_module
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
-from app.routes import chip_requests as chip_requests_route_module
-from app.routes import notifications as notifications_route_module
-
-
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    getter = lambda: db
-    orig_db = db_module.get_database
-    orig_auth = auth_deps_module.get_database
-    orig_games = games_route_module.get_database
-    orig_requests = chip_requests_route_module.get_database
-    orig_notifications = notifications_route_module.get_database
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-    chip_requests_route_module.get_database = getter
-    notifications_route_module.get_database = getter
-
-    yield db
-
-    db_module.get_database = orig_db
-    auth_deps_module.get_database = orig_auth
-    games_route_module.get_database = orig_games
-    chip_requests_route_module.get_database = orig_requests
-    notifications_route_module.get_database = orig_notifications
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -119,7 +61,6 @@ async def _create_and_decline_request(test_client, game_id, player_token, manage
 
 class TestGetNotifications:
 
-    @pytest.mark.asyncio
     async def test_get_notifications_returns_unread(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -143,7 +84,6 @@ class TestGetNotifications:
         assert "message" in notif
         assert "created_at" in notif
 
-    @pytest.mark.asyncio
     async def test_get_notifications_empty_when_no_activity(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -156,13 +96,11 @@ class TestGetNotifications:
         assert data["unread_count"] == 0
         assert data["notifications"] == []
 
-    @pytest.mark.asyncio
     async def test_get_notifications_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.get(f"/api/games/{game['game_id']}/notifications")
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_get_notifications_multiple(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -182,7 +120,6 @@ class TestGetNotifications:
         assert data["unread_count"] >= 2
         assert len(data["notifications"]) >= 2
 
-    @pytest.mark.asyncio
     async def test_notifications_are_scoped_to_player(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -208,7 +145,6 @@ class TestGetNotifications:
 
 class TestMarkNotificationRead:
 
-    @pytest.mark.asyncio
     async def test_mark_read_returns_success(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -229,7 +165,6 @@ class TestMarkNotificationRead:
         assert resp.status_code == 200
         assert resp.json()["success"] is True
 
-    @pytest.mark.asyncio
     async def test_mark_read_reduces_unread_count(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -255,7 +190,6 @@ class TestMarkNotificationRead:
         )
         assert resp.json()["unread_count"] == initial_count - 1
 
-    @pytest.mark.asyncio
     async def test_mark_read_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -263,7 +197,6 @@ class TestMarkNotificationRead:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_mark_read_wrong_player_returns_403(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -291,7 +224,6 @@ class TestMarkNotificationRead:
 
 class TestMarkAllRead:
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_returns_count(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -309,7 +241,6 @@ class TestMarkAllRead:
         data = resp.json()
         assert data["marked_count"] >= 2
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_then_zero_unread(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -329,7 +260,6 @@ class TestMarkAllRead:
         assert resp.status_code == 200
         assert resp.json()["unread_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_when_none_returns_zero(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -340,7 +270,6 @@ class TestMarkAllRead:
         assert resp.status_code == 200
         assert resp.json()["marked_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -348,7 +277,6 @@ class TestMarkAllRead:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_only_affects_own_notifications(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
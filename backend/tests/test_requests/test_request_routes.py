@@ -4,65 +4,11 @@ Tests the full HTTP stack using HTTPX AsyncClient with the FastAPI app
 and mongomock-motor (no real MongoDB required).
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
-
-from app.dal import database as db_module
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
-from app.routes import chip_requests as chip_requests_route_module
-from app.routes import notifications as notifications_route_module
-
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Helpers
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    getter = lambda: db
-    orig_db = db_module.get_database
-    orig_auth = auth_deps_module.get_database
-    orig_games = games_route_module.get_database
-    orig_requests = chip_requests_route_module.get_database
-    orig_notifications = notifications_route_module.get_database
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-    chip_requests_route_module.get_database = getter
-    notifications_route_module.get_database = getter
-
-    yield db
-
-    db_module.get_database = orig_db
-    auth_deps_module.get_database = orig_auth
-    games_route_module.get_database = orig_games
-    chip_requests_route_module.get_database = orig_requests
-    notifications_route_module.get_database = orig_notifications
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
 async def _create_game(test_client, manager_name="Alice"):
     resp = await test_client.post("/api/games", json={"manager_name": manager_name})
     assert resp.status_code == 201
@@ -91,7 +37,6 @@ async def _create_request(test_client, game_id, player_token, request_type="CASH
 
 class TestCreateChipRequest:
 
-    @pytest.mark.asyncio
     async def test_create_cash_request_returns_201(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -108,7 +53,6 @@ class TestCreateChipRequest:
         assert data["player_token"] == bob["player_token"]
         assert "id" in data
 
-    @pytest.mark.asyncio
     async def test_create_credit_request(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -120,7 +64,6 @@ class TestCreateChipRequest:
         assert resp.status_code == 201
         assert resp.json()["request_type"] == "CREDIT"
 
-    @pytest.mark.asyncio
     async def test_create_request_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -129,7 +72,6 @@ class TestCreateChipRequest:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_create_request_invalid_amount_returns_422(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -140,7 +82,6 @@ class TestCreateChipRequest:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_request_negative_amount_returns_422(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -158,7 +99,6 @@ class TestCreateChipRequest:
 
 class TestGetPendingRequests:
 
-    @pytest.mark.asyncio
     async def test_pending_returns_only_pending(self, test_client):
         game = await _create_game(test_client)
         manager_token = game["player_token"]
@@ -178,7 +118,6 @@ class TestGetPendingRequests:
         assert len(data) == 1
         assert data[0]["id"] == req2["id"]
 
-    @pytest.mark.asyncio
     async def test_pending_includes_player_name(self, test_client):
         """Verify that pending requests include the player_name field."""
         game = await _create_game(test_client)
@@ -194,7 +133,6 @@ class TestGetPendingRequests:
         assert len(data) == 1
         assert data[0]["player_name"] == "Bob"
 
-    @pytest.mark.asyncio
     async def test_pending_requires_manager(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -204,7 +142,6 @@ class TestGetPendingRequests:
         )
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_pending_empty_list(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.get(
@@ -221,7 +158,6 @@ class TestGetPendingRequests:
 
 class TestGetMyRequests:
 
-    @pytest.mark.asyncio
     async def test_mine_returns_own_requests(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -237,7 +173,6 @@ class TestGetMyRequests:
         assert len(data) == 1
         assert data[0]["player_token"] == bob["player_token"]
 
-    @pytest.mark.asyncio
     async def test_mine_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.get(f"/api/games/{game['game_id']}/requests/mine")
@@ -250,7 +185,6 @@ class TestGetMyRequests:
 
 class TestApproveRequest:
 
-    @pytest.mark.asyncio
     async def test_approve_returns_approved_status(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -265,7 +199,6 @@ class TestApproveRequest:
         assert data["resolved_by"] == game["player_token"]
         assert data["resolved_at"] is not None
 
-    @pytest.mark.asyncio
     async def test_approve_already_approved_returns_400(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -280,7 +213,6 @@ class TestApproveRequest:
         )
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_approve_requires_manager(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -298,7 +230,6 @@ class TestApproveRequest:
 
 class TestDeclineRequest:
 
-    @pytest.mark.asyncio
     async def test_decline_returns_declined_status(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -312,7 +243,6 @@ class TestDeclineRequest:
         assert data["status"] == "DECLINED"
         assert data["resolved_by"] == game["player_token"]
 
-    @pytest.mark.asyncio
     async def test_decline_already_declined_returns_400(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -327,7 +257,6 @@ class TestDeclineRequest:
         )
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_decline_requires_manager(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -345,7 +274,6 @@ class TestDeclineRequest:
 
 class TestEditAndApproveRequest:
 
-    @pytest.mark.asyncio
     async def test_edit_returns_edited_status(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -361,7 +289,6 @@ class TestEditAndApproveRequest:
         assert data["edited_amount"] == 75
         assert data["amount"] == 100
 
-    @pytest.mark.asyncio
     async def test_edit_invalid_amount_returns_422(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -373,7 +300,6 @@ class TestEditAndApproveRequest:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_edit_requires_manager(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -385,7 +311,6 @@ class TestEditAndApproveRequest:
         )
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_edit_already_processed_returns_400(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
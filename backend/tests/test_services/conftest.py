@@ -0,0 +1,152 @@
+"""Shared fixtures for service-layer tests.
+
+Every service test runs against the same mongomock-motor backend and the
+same DAL/service wiring. DALs and services are stateless wrappers around
+the shared database, so they are built once per session; only the data
+is reset between tests.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+from app.auth.player_token import generate_player_token
+from app.dal.chip_requests_dal import ChipRequestDAL
+from app.dal.games_dal import GameDAL
+from app.dal.notifications_dal import NotificationDAL
+from app.dal.players_dal import PlayerDAL
+from app.models.chip_request import ChipRequest
+from app.models.common import GameStatus, RequestType
+from app.models.game import GAME_TTL, Game
+from app.models.player import Player
+from app.services.game_service import GameService, _CODE_CHARS, _CODE_LENGTH
+from app.services.request_service import RequestService
+from app.services.settlement_service import SettlementService
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def mock_db(test_db):
+    """Provide the shared in-memory mock MongoDB database.
+
+    Autouse so that every service test empties the database afterwards,
+    including tests that only request the session-scoped DALs/services.
+    """
+    return test_db
+
+
+@pytest.fixture(scope="session")
+def game_dal(session_db) -> GameDAL:
+    return GameDAL(session_db)
+
+
+@pytest.fixture(scope="session")
+def player_dal(session_db) -> PlayerDAL:
+    return PlayerDAL(session_db)
+
+
+@pytest.fixture(scope="session")
+def chip_request_dal(session_db) -> ChipRequestDAL:
+    return ChipRequestDAL(session_db)
+
+
+@pytest.fixture(scope="session")
+def notification_dal(session_db) -> NotificationDAL:
+    return NotificationDAL(session_db)
+
+
+@pytest.fixture(scope="session")
+def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
+    return GameService(game_dal, player_dal, chip_request_dal)
+
+
+@pytest.fixture(scope="session")
+def request_service(
+    game_dal, player_dal, chip_request_dal, notification_dal
+) -> RequestService:
+    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
+
+
+@pytest.fixture(scope="session")
+def settlement_service(
+    game_dal, player_dal, chip_request_dal, notification_dal
+) -> SettlementService:
+    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
+
+
+@pytest.fixture(scope="session")
+def approved_buy_in(request_service):
+    """Return a coroutine function that creates and approves a buy-in.
+
+    Goes through the real ``create_request``/``approve_request`` path so
+    bank and credit side effects match production.
+    """
+
+    async def _approved_buy_in(
+        game_id: str,
+        player_token: str,
+        request_type: RequestType,
+        amount: int,
+        manager_token: str,
+    ) -> ChipRequest:
+        chip_request = await request_service.create_request(
+            game_id=game_id,
+            player_token=player_token,
+            request_type=request_type,
+            amount=amount,
+        )
+        return await request_service.approve_request(
+            game_id=game_id,
+            request_id=str(chip_request.id),
+            manager_token=manager_token,
+        )
+
+    return _approved_buy_in
+
+
+@pytest.fixture(scope="session")
+def seed_game(session_db, game_dal):
+    """Return a coroutine function that inserts an OPEN game and its players.
+
+    Bypasses ``GameService.create_game``/``join_game`` (covered by
+    ``test_game_service.py``) and writes all player documents with one
+    ``insert_many``. Join times increase in argument order so
+    ``joined_at``-sorted queries see the same order as sequential joins.
+    """
+
+    async def _seed_game(manager_name: str, *player_names: str) -> dict:
+        now = datetime.now(timezone.utc)
+        manager_token = generate_player_token()
+        game = await game_dal.create(Game(
+            code="".join(random.choices(_CODE_CHARS, k=_CODE_LENGTH)),
+            status=GameStatus.OPEN,
+            manager_player_token=manager_token,
+            created_at=now,
+            expires_at=now + GAME_TTL,
+        ))
+        game_id = str(game.id)
+
+        player_tokens = [generate_player_token() for _ in player_names]
+        players = [
+            Player(
+                game_id=game_id,
+                player_token=token,
+                display_name=name,
+                is_manager=token == manager_token,
+                joined_at=now + timedelta(milliseconds=i),
+            )
+            for i, (token, name) in enumerate(
+                zip([manager_token, *player_tokens], [manager_name, *player_names])
+            )
+        ]
+        await session_db["players"].insert_many(
+            [player.to_mongo_dict() for player in players]
+        )
+        return {
+            "game_id": game_id,
+            "manager_token": manager_token,
+            "player_tokens": player_tokens,
+        }
+
+    return _seed_game
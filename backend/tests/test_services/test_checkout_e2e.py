@@ -13,68 +13,11 @@ Verifies credit deduction math, pool accounting, and status transitions
 throughout the entire lifecycle.
 """
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
-import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import CheckoutStatus, GameStatus, RequestType
-from app.services.settlement_service import SettlementService
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
-
-
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
 
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(game_dal, player_dal, chip_request_dal, notification_dal) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settlement_service(game_dal, player_dal, chip_request_dal, notification_dal) -> SettlementService:
-    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
+pytestmark = pytest.mark.slow
 
 
 # ---------------------------------------------------------------------------
@@ -86,7 +29,7 @@ class TestCheckoutEndToEnd:
     async def test_full_checkout_flow(
         self,
         game_service,
-        request_service,
+        approved_buy_in,
         settlement_service,
         game_dal,
         player_dal,
@@ -115,52 +58,17 @@ class TestCheckoutEndToEnd:
         # ==================================================================
 
         # Alice buys in 200 cash
-        alice_req = await request_service.create_request(
-            game_id=game_id, player_token=alice_token,
-            request_type=RequestType.CASH, amount=200,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(alice_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, alice_token, RequestType.CASH, 200, manager_token=alice_token)
 
         # Bob buys in 100 cash + 100 credit
-        bob_cash_req = await request_service.create_request(
-            game_id=game_id, player_token=bob_token,
-            request_type=RequestType.CASH, amount=100,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(bob_cash_req.id),
-            manager_token=alice_token,
-        )
-        bob_credit_req = await request_service.create_request(
-            game_id=game_id, player_token=bob_token,
-            request_type=RequestType.CREDIT, amount=100,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(bob_credit_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=alice_token)
+        await approved_buy_in(game_id, bob_token, RequestType.CREDIT, 100, manager_token=alice_token)
 
         # Charlie buys in 150 cash
-        charlie_req = await request_service.create_request(
-            game_id=game_id, player_token=charlie_token,
-            request_type=RequestType.CASH, amount=150,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(charlie_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, charlie_token, RequestType.CASH, 150, manager_token=alice_token)
 
         # Dave buys in 100 credit
-        dave_req = await request_service.create_request(
-            game_id=game_id, player_token=dave_token,
-            request_type=RequestType.CREDIT, amount=100,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(dave_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, dave_token, RequestType.CREDIT, 100, manager_token=alice_token)
 
         # ==================================================================
         # Step 4: Start settling
@@ -351,7 +259,7 @@ class TestCheckoutEndToEnd:
     async def test_midgame_checkout_then_settle_remaining(
         self,
         game_service,
-        request_service,
+        approved_buy_in,
         settlement_service,
         game_dal,
         player_dal,
@@ -370,34 +278,13 @@ class TestCheckoutEndToEnd:
         charlie_token = charlie_data["player_token"]
 
         # Alice: 200 cash
-        alice_req = await request_service.create_request(
-            game_id=game_id, player_token=alice_token,
-            request_type=RequestType.CASH, amount=200,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(alice_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, alice_token, RequestType.CASH, 200, manager_token=alice_token)
 
         # Bob: 100 cash (will checkout mid-game)
-        bob_req = await request_service.create_request(
-            game_id=game_id, player_token=bob_token,
-            request_type=RequestType.CASH, amount=100,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(bob_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=alice_token)
 
         # Charlie: 100 cash
-        charlie_req = await request_service.create_request(
-            game_id=game_id, player_token=charlie_token,
-            request_type=RequestType.CASH, amount=100,
-        )
-        await request_service.approve_request(
-            game_id=game_id, request_id=str(charlie_req.id),
-            manager_token=alice_token,
-        )
+        await approved_buy_in(game_id, charlie_token, RequestType.CASH, 100, manager_token=alice_token)
 
         # ── Mid-game checkout for Bob ────────────────────────────────────
 
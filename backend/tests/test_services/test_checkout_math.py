@@ -3,90 +3,96 @@
 Covers all P/L, credit deduction, and pool calculations from the design doc.
 """
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
+import pytest
 
 from app.services.checkout_math import compute_credit_deduction, compute_distribution_suggestion
 
 
-class TestComputeCreditDeduction:
-    """Tests based on design doc examples: 100 cash + 100 credit = 200 buy-in."""
-
-    def test_returns_0(self):
-        result = compute_credit_deduction(final_chips=0, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == -200
-        assert result["credit_owed"] == 100
-        assert result["credit_repaid"] == 0
-        assert result["chips_after_credit"] == 0
-        assert result["total_buy_in"] == 200
-
-    def test_returns_50(self):
-        result = compute_credit_deduction(final_chips=50, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == -150
-        assert result["credit_owed"] == 50
-        assert result["credit_repaid"] == 50
-        assert result["chips_after_credit"] == 0
-
-    def test_returns_100(self):
-        result = compute_credit_deduction(final_chips=100, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == -100
-        assert result["credit_owed"] == 0
-        assert result["credit_repaid"] == 100
-        assert result["chips_after_credit"] == 0
-
-    def test_returns_150(self):
-        result = compute_credit_deduction(final_chips=150, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == -50
-        assert result["credit_owed"] == 0
-        assert result["credit_repaid"] == 100
-        assert result["chips_after_credit"] == 50
+# (final_chips, total_cash_in, total_credit_in, expected subset of the result)
+CREDIT_DEDUCTION_CASES = [
+    pytest.param(
+        0, 100, 100,
+        {"profit_loss": -200, "credit_owed": 100, "credit_repaid": 0,
+         "chips_after_credit": 0, "total_buy_in": 200},
+        id="returns_0",
+    ),
+    pytest.param(
+        50, 100, 100,
+        {"profit_loss": -150, "credit_owed": 50, "credit_repaid": 50,
+         "chips_after_credit": 0},
+        id="returns_50",
+    ),
+    pytest.param(
+        100, 100, 100,
+        {"profit_loss": -100, "credit_owed": 0, "credit_repaid": 100,
+         "chips_after_credit": 0},
+        id="returns_100",
+    ),
+    pytest.param(
+        150, 100, 100,
+        {"profit_loss": -50, "credit_owed": 0, "credit_repaid": 100,
+         "chips_after_credit": 50},
+        id="returns_150",
+    ),
+    pytest.param(
+        200, 100, 100,
+        {"profit_loss": 0, "credit_owed": 0, "credit_repaid": 100,
+         "chips_after_credit": 100},
+        id="returns_200_break_even",
+    ),
+    pytest.param(
+        250, 100, 100,
+        {"profit_loss": 50, "credit_owed": 0, "credit_repaid": 100,
+         "chips_after_credit": 150},
+        id="returns_250_profit",
+    ),
+    pytest.param(
+        150, 100, 0,
+        {"profit_loss": 50, "credit_owed": 0, "credit_repaid": 0,
+         "chips_after_credit": 150},
+        id="cash_only_player",
+    ),
+    pytest.param(
+        50, 0, 200,
+        {"profit_loss": -150, "credit_owed": 150, "credit_repaid": 50,
+         "chips_after_credit": 0},
+        id="credit_only_player",
+    ),
+    # 200 cash + 400 credit returning 300 chips: all chips go to credit,
+    # still owes 100, nothing left for cash.
+    pytest.param(
+        300, 200, 400,
+        {"total_buy_in": 600, "profit_loss": -300, "credit_repaid": 300,
+         "credit_owed": 100, "chips_after_credit": 0},
+        id="high_credit_low_chips_300",
+    ),
+    # 200 cash + 400 credit returning 500 chips: credit fully repaid,
+    # 500 - 400 = 100 left for cash.
+    pytest.param(
+        500, 200, 400,
+        {"total_buy_in": 600, "profit_loss": -100, "credit_repaid": 400,
+         "credit_owed": 0, "chips_after_credit": 100},
+        id="high_credit_low_chips_500",
+    ),
+]
 
-    def test_returns_200_break_even(self):
-        result = compute_credit_deduction(final_chips=200, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == 0
-        assert result["credit_owed"] == 0
-        assert result["credit_repaid"] == 100
-        assert result["chips_after_credit"] == 100
 
-    def test_returns_250_profit(self):
-        result = compute_credit_deduction(final_chips=250, total_cash_in=100, total_credit_in=100)
-        assert result["profit_loss"] == 50
-        assert result["credit_owed"] == 0
-        assert result["credit_repaid"] == 100
-        assert result["chips_after_credit"] == 150
-
-    def test_cash_only_player(self):
-        result = compute_credit_deduction(final_chips=150, total_cash_in=100, total_credit_in=0)
-        assert result["profit_loss"] == 50
-        assert result["credit_owed"] == 0
-        assert result["credit_repaid"] == 0
-        assert result["chips_after_credit"] == 150
-
-    def test_credit_only_player(self):
-        result = compute_credit_deduction(final_chips=50, total_cash_in=0, total_credit_in=200)
-        assert result["profit_loss"] == -150
-        assert result["credit_owed"] == 150
-        assert result["credit_repaid"] == 50
-        assert result["chips_after_credit"] == 0
-
-
-    def test_high_credit_low_chips_200_cash_400_credit_300_chips(self):
-        """Player with 200 cash + 400 credit returning 300 chips gets 0 after credit."""
-        result = compute_credit_deduction(final_chips=300, total_cash_in=200, total_credit_in=400)
-        assert result["total_buy_in"] == 600
-        assert result["profit_loss"] == -300
-        assert result["credit_repaid"] == 300  # all chips go to credit
-        assert result["credit_owed"] == 100  # still owes 100
-        assert result["chips_after_credit"] == 0  # nothing left for cash
+class TestComputeCreditDeduction:
+    """Tests based on design doc examples: 100 cash + 100 credit = 200 buy-in."""
 
-    def test_high_credit_low_chips_200_cash_400_credit_500_chips(self):
-        """Player with 200 cash + 400 credit returning 500 chips gets 100 after credit."""
-        result = compute_credit_deduction(final_chips=500, total_cash_in=200, total_credit_in=400)
-        assert result["total_buy_in"] == 600
-        assert result["profit_loss"] == -100
-        assert result["credit_repaid"] == 400  # all credit repaid
-        assert result["credit_owed"] == 0
-        assert result["chips_after_credit"] == 100  # 500 - 400 = 100 for cash
+    @pytest.mark.parametrize(
+        "final_chips,total_cash_in,total_credit_in,expected",
+        CREDIT_DEDUCTION_CASES,
+    )
+    def test_credit_deduction(
+        self, final_chips, total_cash_in, total_credit_in, expected
+    ):
+        result = compute_credit_deduction(
+            final_chips=final_chips,
+            total_cash_in=total_cash_in,
+            total_credit_in=total_credit_in,
+        )
+        assert {key: result[key] for key in expected} == expected
 
 
 class TestComputeDistributionSuggestion:
@@ -1,21 +1,10 @@
 """Unit tests for mid-game checkout (single player checkout during OPEN state)."""
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
 import pytest_asyncio
 from fastapi import HTTPException
-from mongomock_motor import AsyncMongoMockClient
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import GameStatus, CheckoutStatus, RequestType
-from app.services.settlement_service import SettlementService
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
 
 
 # ---------------------------------------------------------------------------
@@ -23,78 +12,18 @@ from app.services.request_service import RequestService
 # ---------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(game_dal, player_dal, chip_request_dal, notification_dal) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settlement_service(game_dal, player_dal, chip_request_dal, notification_dal) -> SettlementService:
-    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def open_game_with_cash_player(game_service, request_service):
+async def open_game_with_cash_player(seed_game, approved_buy_in):
     """Create an open game with manager Alice (200 cash) and cash-only player Bob (100 cash)."""
-    game_data = await game_service.create_game(manager_name="Alice")
-    game_id = game_data["game_id"]
-    manager_token = game_data["player_token"]
-
-    # Bob joins
-    bob_data = await game_service.join_game(game_id, player_name="Bob")
-    bob_token = bob_data["player_token"]
+    seeded = await seed_game("Alice", "Bob")
+    game_id = seeded["game_id"]
+    manager_token = seeded["manager_token"]
+    (bob_token,) = seeded["player_tokens"]
 
     # Alice buys in 200 cash
-    alice_req = await request_service.create_request(
-        game_id=game_id, player_token=manager_token,
-        request_type=RequestType.CASH, amount=200,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(alice_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, manager_token, RequestType.CASH, 200, manager_token=manager_token)
 
     # Bob buys in 100 cash only
-    bob_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CASH, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_cash_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=manager_token)
 
     return {
         "game_id": game_id,
@@ -104,43 +33,20 @@ async def open_game_with_cash_player(game_service, request_service):
 
 
 @pytest_asyncio.fixture
-async def open_game_with_credit_player(game_service, request_service):
+async def open_game_with_credit_player(seed_game, approved_buy_in):
     """Create an open game with manager Alice and player Bob who has cash + credit."""
-    game_data = await game_service.create_game(manager_name="Alice")
-    game_id = game_data["game_id"]
-    manager_token = game_data["player_token"]
-
-    bob_data = await game_service.join_game(game_id, player_name="Bob")
-    bob_token = bob_data["player_token"]
+    seeded = await seed_game("Alice", "Bob")
+    game_id = seeded["game_id"]
+    manager_token = seeded["manager_token"]
+    (bob_token,) = seeded["player_tokens"]
 
     # Alice buys in 200 cash
-    alice_req = await request_service.create_request(
-        game_id=game_id, player_token=manager_token,
-        request_type=RequestType.CASH, amount=200,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(alice_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, manager_token, RequestType.CASH, 200, manager_token=manager_token)
 
     # Bob buys in 100 cash + 100 credit
-    bob_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CASH, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_cash_req.id),
-        manager_token=manager_token,
-    )
-
-    bob_credit_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CREDIT, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_credit_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=manager_token)
+
+    await approved_buy_in(game_id, bob_token, RequestType.CREDIT, 100, manager_token=manager_token)
 
     return {
         "game_id": game_id,
@@ -10,13 +10,9 @@ Tests cover:
     - format_notification_message helper
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
 from app.dal.notifications_dal import NotificationDAL
 from app.models.common import NotificationType
@@ -32,26 +28,12 @@ from app.services.notification_service import (
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
 @pytest_asyncio.fixture
 async def service(mock_db) -> NotificationService:
     """Provide a NotificationService instance backed by the mock database."""
     return NotificationService(notification_dal=NotificationDAL(mock_db))
 
 
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
 GAME_ID = "665f1a2b3c4d5e6f7a8b9c0d"
 PLAYER_TOKEN_A = "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
 PLAYER_TOKEN_B = "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"
@@ -63,7 +45,6 @@ PLAYER_TOKEN_B = "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"
 
 class TestCreateNotification:
 
-    @pytest.mark.asyncio
     async def test_create_notification_returns_notification_with_id(
         self, service: NotificationService
     ):
@@ -80,7 +61,6 @@ class TestCreateNotification:
         assert result.message == "Your request was approved"
         assert result.is_read is False
 
-    @pytest.mark.asyncio
     async def test_create_notification_with_related_id(
         self, service: NotificationService
     ):
@@ -100,7 +80,6 @@ class TestCreateNotification:
 
 class TestCreateBulkNotifications:
 
-    @pytest.mark.asyncio
     async def test_bulk_create_multiple_players(
         self, service: NotificationService
     ):
@@ -116,7 +95,6 @@ class TestCreateBulkNotifications:
         returned_tokens = {n.player_token for n in result}
         assert returned_tokens == set(tokens)
 
-    @pytest.mark.asyncio
     async def test_bulk_create_empty_list_returns_empty(
         self, service: NotificationService
     ):
@@ -135,7 +113,6 @@ class TestCreateBulkNotifications:
 
 class TestGetPlayerNotifications:
 
-    @pytest.mark.asyncio
     async def test_get_unread_only(self, service: NotificationService):
         await service.create_notification(
             GAME_ID, PLAYER_TOKEN_A,
@@ -147,7 +124,6 @@ class TestGetPlayerNotifications:
         assert len(result) == 1
         assert result[0].is_read is False
 
-    @pytest.mark.asyncio
     async def test_get_all_including_read(
         self, service: NotificationService, notification_dal: NotificationDAL
     ):
@@ -170,7 +146,6 @@ class TestGetPlayerNotifications:
         )
         assert len(all_notifs) == 1
 
-    @pytest.mark.asyncio
     async def test_get_notifications_scoped_to_player(
         self, service: NotificationService
     ):
@@ -195,12 +170,10 @@ class TestGetPlayerNotifications:
 
 class TestGetUnreadCount:
 
-    @pytest.mark.asyncio
     async def test_unread_count_zero_initially(self, service: NotificationService):
         count = await service.get_unread_count(GAME_ID, PLAYER_TOKEN_A)
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_unread_count_increments(self, service: NotificationService):
         await service.create_notification(
             GAME_ID, PLAYER_TOKEN_A,
@@ -220,7 +193,6 @@ class TestGetUnreadCount:
 
 class TestMarkNotificationRead:
 
-    @pytest.mark.asyncio
     async def test_mark_read_success(self, service: NotificationService):
         n = await service.create_notification(
             GAME_ID, PLAYER_TOKEN_A,
@@ -232,12 +204,9 @@ class TestMarkNotificationRead:
         count = await service.get_unread_count(GAME_ID, PLAYER_TOKEN_A)
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_mark_read_wrong_player_raises_403(
         self, service: NotificationService
     ):
-        from fastapi import HTTPException
-
         n = await service.create_notification(
             GAME_ID, PLAYER_TOKEN_A,
             NotificationType.REQUEST_APPROVED, "Approved",
@@ -246,24 +215,18 @@ class TestMarkNotificationRead:
             await service.mark_notification_read(n.id, PLAYER_TOKEN_B)
         assert exc_info.value.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_mark_read_nonexistent_raises_404(
         self, service: NotificationService
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.mark_notification_read(
                 "000000000000000000000000", PLAYER_TOKEN_A
             )
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_mark_read_invalid_id_raises_404(
         self, service: NotificationService
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await service.mark_notification_read("not-valid-id", PLAYER_TOKEN_A)
         assert exc_info.value.status_code == 404
@@ -275,7 +238,6 @@ class TestMarkNotificationRead:
 
 class TestMarkAllRead:
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_returns_count(self, service: NotificationService):
         await service.create_notification(
             GAME_ID, PLAYER_TOKEN_A,
@@ -291,14 +253,12 @@ class TestMarkAllRead:
         remaining = await service.get_unread_count(GAME_ID, PLAYER_TOKEN_A)
         assert remaining == 0
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_when_none_returns_zero(
         self, service: NotificationService
     ):
         count = await service.mark_all_read(GAME_ID, PLAYER_TOKEN_A)
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_mark_all_read_does_not_affect_other_player(
         self, service: NotificationService
     ):
@@ -321,34 +281,33 @@ class TestMarkAllRead:
 # format_notification_message helper
 # ---------------------------------------------------------------------------
 
-class TestFormatNotificationMessage:
+# (template, kwargs, lowercase substrings the rendered message must contain)
+FORMAT_CASES = [
+    pytest.param(
+        "REQUEST_APPROVED", {"type": "cash", "amount": 100}, ("100", "approved"),
+        id="request_approved",
+    ),
+    pytest.param(
+        "REQUEST_DECLINED", {"type": "credit", "amount": 50}, ("50", "declined"),
+        id="request_declined",
+    ),
+    pytest.param(
+        "REQUEST_EDITED", {"new_amount": 75, "original_amount": 100}, ("75", "100"),
+        id="request_edited",
+    ),
+    pytest.param(
+        "CHECKOUT_PROCESSED", {"final_chips": 120, "profit_loss": "+20"}, ("120",),
+        id="checkout_processed",
+    ),
+]
 
-    def test_request_approved_template(self):
-        msg = format_notification_message(
-            "REQUEST_APPROVED", type="cash", amount=100
-        )
-        assert "100" in msg
-        assert "approved" in msg.lower()
 
-    def test_request_declined_template(self):
-        msg = format_notification_message(
-            "REQUEST_DECLINED", type="credit", amount=50
-        )
-        assert "50" in msg
-        assert "declined" in msg.lower()
-
-    def test_request_edited_template(self):
-        msg = format_notification_message(
-            "REQUEST_EDITED", new_amount=75, original_amount=100
-        )
-        assert "75" in msg
-        assert "100" in msg
+class TestFormatNotificationMessage:
 
-    def test_checkout_processed_template(self):
-        msg = format_notification_message(
-            "CHECKOUT_PROCESSED", final_chips=120, profit_loss="+20"
-        )
-        assert "120" in msg
+    @pytest.mark.parametrize("template,kwargs,expected", FORMAT_CASES)
+    def test_template_renders(self, template, kwargs, expected):
+        msg = format_notification_message(template, **kwargs).lower()
+        assert all(part in msg for part in expected), msg
 
     def test_unknown_template_raises_key_error(self):
         with pytest.raises(KeyError):
@@ -9,67 +9,17 @@ Tests cover:
     - Request not found / request in wrong game validation
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import GameStatus, RequestType, RequestStatus
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(
-    game_dal, player_dal, chip_request_dal, notification_dal
-) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
 @pytest_asyncio.fixture
 async def open_game(game_service):
     """Create an open game with manager 'Alice' and return game data."""
@@ -90,7 +40,6 @@ async def player_bob(game_service, open_game):
 
 class TestCreateRequest:
 
-    @pytest.mark.asyncio
     async def test_create_cash_request(
         self, request_service, open_game, player_bob
     ):
@@ -107,7 +56,6 @@ class TestCreateRequest:
         assert result.amount == 100
         assert result.status == RequestStatus.PENDING
 
-    @pytest.mark.asyncio
     async def test_create_credit_request(
         self, request_service, open_game, player_bob
     ):
@@ -120,7 +68,6 @@ class TestCreateRequest:
         assert result.request_type == RequestType.CREDIT
         assert result.amount == 50
 
-    @pytest.mark.asyncio
     async def test_create_request_on_behalf_of(
         self, request_service, game_service, open_game, player_bob
     ):
@@ -137,12 +84,9 @@ class TestCreateRequest:
         assert result.player_token == player_bob["player_token"]
         assert result.requested_by == manager_token
 
-    @pytest.mark.asyncio
     async def test_create_request_non_open_game_raises_400(
         self, request_service, game_dal, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         await game_dal.update_status(open_game["game_id"], GameStatus.SETTLING)
 
         with pytest.raises(HTTPException) as exc_info:
@@ -154,12 +98,9 @@ class TestCreateRequest:
             )
         assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_create_request_nonexistent_game_raises_404(
         self, request_service, player_bob
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.create_request(
                 game_id="000000000000000000000000",
@@ -169,12 +110,9 @@ class TestCreateRequest:
             )
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_create_request_nonexistent_player_raises_404(
         self, request_service, open_game
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.create_request(
                 game_id=open_game["game_id"],
@@ -184,12 +122,9 @@ class TestCreateRequest:
             )
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_create_request_zero_amount_raises_400(
         self, request_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.create_request(
                 game_id=open_game["game_id"],
@@ -199,12 +134,9 @@ class TestCreateRequest:
             )
         assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_create_request_negative_amount_raises_400(
         self, request_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.create_request(
                 game_id=open_game["game_id"],
@@ -221,7 +153,6 @@ class TestCreateRequest:
 
 class TestApproveRequest:
 
-    @pytest.mark.asyncio
     async def test_approve_cash_request_updates_bank(
         self, request_service, game_dal, open_game, player_bob
     ):
@@ -241,7 +172,6 @@ class TestApproveRequest:
         assert game.bank.total_chips_issued == 100
         assert game.bank.chips_in_play == 100
 
-    @pytest.mark.asyncio
     async def test_approve_credit_request_updates_bank_and_player(
         self, request_service, game_dal, player_dal, open_game, player_bob
     ):
@@ -265,12 +195,9 @@ class TestApproveRequest:
         )
         assert player.credits_owed == 75
 
-    @pytest.mark.asyncio
     async def test_approve_nonexistent_request_raises_404(
         self, request_service, open_game
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.approve_request(
                 open_game["game_id"],
@@ -279,12 +206,9 @@ class TestApproveRequest:
             )
         assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_approve_request_wrong_game_raises_404(
         self, request_service, game_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         req = await request_service.create_request(
             open_game["game_id"], player_bob["player_token"],
             RequestType.CASH, 100,
@@ -305,7 +229,6 @@ class TestApproveRequest:
 
 class TestDeclineRequest:
 
-    @pytest.mark.asyncio
     async def test_decline_request_no_bank_changes(
         self, request_service, game_dal, open_game, player_bob
     ):
@@ -323,12 +246,9 @@ class TestDeclineRequest:
         assert game.bank.total_cash_in == 0
         assert game.bank.chips_in_play == 0
 
-    @pytest.mark.asyncio
     async def test_decline_already_approved_raises_400(
         self, request_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         req = await request_service.create_request(
             open_game["game_id"], player_bob["player_token"],
             RequestType.CASH, 100,
@@ -349,7 +269,6 @@ class TestDeclineRequest:
 
 class TestEditAndApproveRequest:
 
-    @pytest.mark.asyncio
     async def test_edit_and_approve_uses_new_amount_for_bank(
         self, request_service, game_dal, open_game, player_bob
     ):
@@ -370,12 +289,9 @@ class TestEditAndApproveRequest:
         assert game.bank.total_cash_in == 60
         assert game.bank.total_chips_issued == 60
 
-    @pytest.mark.asyncio
     async def test_edit_with_zero_amount_raises_400(
         self, request_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         req = await request_service.create_request(
             open_game["game_id"], player_bob["player_token"],
             RequestType.CASH, 100,
@@ -388,12 +304,9 @@ class TestEditAndApproveRequest:
             )
         assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_edit_already_declined_raises_400(
         self, request_service, open_game, player_bob
     ):
-        from fastapi import HTTPException
-
         req = await request_service.create_request(
             open_game["game_id"], player_bob["player_token"],
             RequestType.CASH, 100,
@@ -416,7 +329,6 @@ class TestEditAndApproveRequest:
 
 class TestQueryMethods:
 
-    @pytest.mark.asyncio
     async def test_get_pending_requests_returns_only_pending(
         self, request_service, open_game, player_bob
     ):
@@ -437,7 +349,6 @@ class TestQueryMethods:
         assert len(pending) == 1
         assert pending[0].id == req2.id
 
-    @pytest.mark.asyncio
     async def test_get_player_requests_returns_all_statuses(
         self, request_service, open_game, player_bob
     ):
@@ -458,12 +369,9 @@ class TestQueryMethods:
         )
         assert len(requests) == 2
 
-    @pytest.mark.asyncio
     async def test_get_pending_for_nonexistent_game_raises_404(
         self, request_service
     ):
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as exc_info:
             await request_service.get_pending_requests("000000000000000000000000")
         assert exc_info.value.status_code == 404
@@ -1,20 +1,12 @@
 """Unit tests for SettlementService distribution, confirm, actions, and close game."""
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
+from datetime import timedelta
 
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import CheckoutStatus, GameStatus, RequestType
-from app.services.settlement_service import SettlementService
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
 
 
 # ---------------------------------------------------------------------------
@@ -22,50 +14,7 @@ from app.services.request_service import RequestService
 # ---------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(game_dal, player_dal, chip_request_dal, notification_dal) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settlement_service(game_dal, player_dal, chip_request_dal, notification_dal) -> SettlementService:
-    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def credit_deducted_game(game_service, request_service, settlement_service):
+async def credit_deducted_game(seed_game, approved_buy_in, settlement_service):
     """Create a settling game with players in CREDIT_DEDUCTED status.
 
     Setup:
@@ -78,63 +27,21 @@ async def credit_deducted_game(game_service, request_service, settlement_service
     Cash pool = 200 + 100 + 50 = 350
     Credit pool = 0 (no debtors confirmed yet)
     """
-    game_data = await game_service.create_game(manager_name="Alice")
-    game_id = game_data["game_id"]
-    manager_token = game_data["player_token"]
-
-    # Bob joins
-    bob_data = await game_service.join_game(game_id, player_name="Bob")
-    bob_token = bob_data["player_token"]
-
-    # Charlie joins
-    charlie_data = await game_service.join_game(game_id, player_name="Charlie")
-    charlie_token = charlie_data["player_token"]
+    seeded = await seed_game("Alice", "Bob", "Charlie")
+    game_id = seeded["game_id"]
+    manager_token = seeded["manager_token"]
+    bob_token, charlie_token = seeded["player_tokens"]
 
     # Alice buys in 200 cash
-    alice_req = await request_service.create_request(
-        game_id=game_id, player_token=manager_token,
-        request_type=RequestType.CASH, amount=200,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(alice_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, manager_token, RequestType.CASH, 200, manager_token=manager_token)
 
     # Bob buys in 100 cash + 100 credit
-    bob_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CASH, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_cash_req.id),
-        manager_token=manager_token,
-    )
-    bob_credit_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CREDIT, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_credit_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=manager_token)
+    await approved_buy_in(game_id, bob_token, RequestType.CREDIT, 100, manager_token=manager_token)
 
     # Charlie buys in 50 cash + 150 credit
-    charlie_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=charlie_token,
-        request_type=RequestType.CASH, amount=50,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(charlie_cash_req.id),
-        manager_token=manager_token,
-    )
-    charlie_credit_req = await request_service.create_request(
-        game_id=game_id, player_token=charlie_token,
-        request_type=RequestType.CREDIT, amount=150,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(charlie_credit_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, charlie_token, RequestType.CASH, 50, manager_token=manager_token)
+    await approved_buy_in(game_id, charlie_token, RequestType.CREDIT, 150, manager_token=manager_token)
 
     # Start settling
     await settlement_service.start_settling(game_id)
@@ -322,9 +229,7 @@ class TestGetPlayerActions:
         await settlement_service.override_distribution(game_id, distribution)
 
         actions = await settlement_service.get_player_actions(game_id, bob_token)
-        assert len(actions) == 1
-        assert actions[0]["type"] == "receive_cash"
-        assert actions[0]["amount"] == 50
+        assert actions == [{"type": "receive_cash", "amount": 50}]
 
     async def test_get_player_actions_credit(
         self, settlement_service, credit_deducted_game
@@ -343,14 +248,10 @@ class TestGetPlayerActions:
         await settlement_service.override_distribution(game_id, distribution)
 
         actions = await settlement_service.get_player_actions(game_id, manager_token)
-        # Should have receive_cash and receive_credit
-        cash_actions = [a for a in actions if a["type"] == "receive_cash"]
-        credit_actions = [a for a in actions if a["type"] == "receive_credit"]
-        assert len(cash_actions) == 1
-        assert cash_actions[0]["amount"] == 300
-        assert len(credit_actions) == 1
-        assert credit_actions[0]["from"] == charlie_token
-        assert credit_actions[0]["amount"] == 50
+        assert actions == [
+            {"type": "receive_cash", "amount": 300},
+            {"type": "receive_credit", "from": charlie_token, "amount": 50},
+        ]
 
     async def test_get_debtor_actions(
         self, settlement_service, credit_deducted_game
@@ -369,10 +270,41 @@ class TestGetPlayerActions:
         await settlement_service.override_distribution(game_id, distribution)
 
         actions = await settlement_service.get_player_actions(game_id, charlie_token)
-        pay_actions = [a for a in actions if a["type"] == "pay_credit"]
-        assert len(pay_actions) == 1
-        assert pay_actions[0]["to"] == manager_token
-        assert pay_actions[0]["amount"] == 50
+        assert actions == [{"type": "pay_credit", "to": manager_token, "amount": 50}]
+
+    async def test_get_debtor_actions_multiple_creditors(
+        self, settlement_service, player_dal, credit_deducted_game
+    ):
+        """Debtor owing several players gets one pay_credit per creditor, in join order."""
+        game_id = credit_deducted_game["game_id"]
+        manager_token = credit_deducted_game["manager_token"]
+        bob_token = credit_deducted_game["bob_token"]
+        charlie_token = credit_deducted_game["charlie_token"]
+
+        # The expected order below relies on join times that stay distinct at
+        # BSON's millisecond precision, not on the driver's tie-breaking.
+        manager = await player_dal.get_by_token(game_id, manager_token)
+        bob = await player_dal.get_by_token(game_id, bob_token)
+        assert bob.joined_at - manager.joined_at >= timedelta(milliseconds=1)
+
+        distribution = {
+            manager_token: {"cash": 300, "credit_from": [{"from": charlie_token, "amount": 30}]},
+            bob_token: {"cash": 50, "credit_from": [{"from": charlie_token, "amount": 20}]},
+            charlie_token: {"cash": 0, "credit_from": []},
+        }
+        await settlement_service.override_distribution(game_id, distribution)
+
+        actions = await settlement_service.get_player_actions(game_id, charlie_token)
+        assert actions == [
+            {"type": "pay_credit", "to": manager_token, "amount": 30},
+            {"type": "pay_credit", "to": bob_token, "amount": 20},
+        ]
+
+        bob_actions = await settlement_service.get_player_actions(game_id, bob_token)
+        assert bob_actions == [
+            {"type": "receive_cash", "amount": 50},
+            {"type": "receive_credit", "from": charlie_token, "amount": 20},
+        ]
 
 
 class TestCloseGame:
@@ -383,7 +315,6 @@ class TestCloseGame:
         """400 if any player not DONE."""
         game_id = credit_deducted_game["game_id"]
 
-        from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
             await settlement_service.close_game(game_id)
         assert exc_info.value.status_code == 400
@@ -1,23 +1,13 @@
 """Unit tests for SettlementService.start_settling."""
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import GameStatus, CheckoutStatus, RequestStatus, RequestType
 from app.models.game import Game
 from app.models.player import Player
 from app.models.chip_request import ChipRequest
-from app.services.settlement_service import SettlementService
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
 
 
 # ---------------------------------------------------------------------------
@@ -25,87 +15,20 @@ from app.services.request_service import RequestService
 # ---------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(game_dal, player_dal, chip_request_dal, notification_dal) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settlement_service(game_dal, player_dal, chip_request_dal, notification_dal) -> SettlementService:
-    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def open_game_with_players(game_service, request_service):
+async def open_game_with_players(seed_game, approved_buy_in):
     """Create an open game with manager Alice and player Bob, each with approved buy-ins."""
-    game_data = await game_service.create_game(manager_name="Alice")
-    game_id = game_data["game_id"]
-    manager_token = game_data["player_token"]
-
-    # Bob joins
-    bob_data = await game_service.join_game(game_id, player_name="Bob")
-    bob_token = bob_data["player_token"]
+    seeded = await seed_game("Alice", "Bob")
+    game_id = seeded["game_id"]
+    manager_token = seeded["manager_token"]
+    (bob_token,) = seeded["player_tokens"]
 
     # Alice buys in 200 cash (create + approve)
-    alice_req = await request_service.create_request(
-        game_id=game_id, player_token=manager_token,
-        request_type=RequestType.CASH, amount=200,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(alice_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, manager_token, RequestType.CASH, 200, manager_token=manager_token)
 
     # Bob buys in 100 cash + 100 credit (create + approve each)
-    bob_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CASH, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_cash_req.id),
-        manager_token=manager_token,
-    )
-
-    bob_credit_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CREDIT, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_credit_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=manager_token)
+
+    await approved_buy_in(game_id, bob_token, RequestType.CREDIT, 100, manager_token=manager_token)
 
     return {
         "game_id": game_id,
@@ -179,7 +102,46 @@ class TestStartSettling:
         await settlement_service.start_settling(game_id)
 
         # Try again - should fail
-        from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
             await settlement_service.start_settling(game_id)
         assert exc_info.value.status_code == 400
+
+    async def test_start_settling_freezes_effective_amounts(
+        self, settlement_service, request_service, player_dal, open_game_with_players
+    ):
+        """Edited requests count their edited amount and type; declined ones are ignored."""
+        game_id = open_game_with_players["game_id"]
+        manager_token = open_game_with_players["manager_token"]
+        bob_token = open_game_with_players["bob_token"]
+
+        # Bob asks for 80 cash, manager edits it to 30 credit
+        edited_req = await request_service.create_request(
+            game_id=game_id, player_token=bob_token,
+            request_type=RequestType.CASH, amount=80,
+        )
+        await request_service.edit_and_approve_request(
+            game_id=game_id, request_id=str(edited_req.id),
+            new_amount=30, new_type=RequestType.CREDIT,
+            manager_token=manager_token,
+        )
+
+        # Bob asks for 500 cash, manager declines
+        declined_req = await request_service.create_request(
+            game_id=game_id, player_token=bob_token,
+            request_type=RequestType.CASH, amount=500,
+        )
+        await request_service.decline_request(
+            game_id=game_id, request_id=str(declined_req.id),
+            manager_token=manager_token,
+        )
+
+        result = await settlement_service.start_settling(game_id)
+
+        bob = await player_dal.get_by_token(game_id, bob_token)
+        assert bob.frozen_buy_in == {
+            "total_cash_in": 100,
+            "total_credit_in": 130,
+            "total_buy_in": 230,
+        }
+        # Alice 200 cash + Bob 100 cash
+        assert result["cash_pool"] == 300
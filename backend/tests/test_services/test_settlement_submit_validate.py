@@ -1,20 +1,10 @@
 """Unit tests for SettlementService chip submission, validation, rejection, and manager input."""
 
-import os
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
 import pytest
 import pytest_asyncio
-from mongomock_motor import AsyncMongoMockClient
+from fastapi import HTTPException
 
-from app.dal.chip_requests_dal import ChipRequestDAL
-from app.dal.games_dal import GameDAL
-from app.dal.notifications_dal import NotificationDAL
-from app.dal.players_dal import PlayerDAL
 from app.models.common import CheckoutStatus, GameStatus, RequestType
-from app.services.settlement_service import SettlementService
-from app.services.game_service import GameService
-from app.services.request_service import RequestService
 
 
 # ---------------------------------------------------------------------------
@@ -22,92 +12,25 @@ from app.services.request_service import RequestService
 # ---------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def mock_db():
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-    yield db
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def game_dal(mock_db) -> GameDAL:
-    return GameDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def player_dal(mock_db) -> PlayerDAL:
-    return PlayerDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def chip_request_dal(mock_db) -> ChipRequestDAL:
-    return ChipRequestDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def notification_dal(mock_db) -> NotificationDAL:
-    return NotificationDAL(mock_db)
-
-
-@pytest_asyncio.fixture
-async def game_service(game_dal, player_dal, chip_request_dal) -> GameService:
-    return GameService(game_dal, player_dal, chip_request_dal)
-
-
-@pytest_asyncio.fixture
-async def request_service(game_dal, player_dal, chip_request_dal, notification_dal) -> RequestService:
-    return RequestService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settlement_service(game_dal, player_dal, chip_request_dal, notification_dal) -> SettlementService:
-    return SettlementService(game_dal, player_dal, chip_request_dal, notification_dal)
-
-
-@pytest_asyncio.fixture
-async def settling_game(game_service, request_service, settlement_service):
+async def settling_game(seed_game, approved_buy_in, settlement_service):
     """Create a settling game with Alice (manager, 200 cash) and Bob (100 cash + 100 credit).
 
     All requests are approved, then start_settling is called.
     Returns game_id, manager_token, bob_token.
     """
-    game_data = await game_service.create_game(manager_name="Alice")
-    game_id = game_data["game_id"]
-    manager_token = game_data["player_token"]
-
-    # Bob joins
-    bob_data = await game_service.join_game(game_id, player_name="Bob")
-    bob_token = bob_data["player_token"]
+    seeded = await seed_game("Alice", "Bob")
+    game_id = seeded["game_id"]
+    manager_token = seeded["manager_token"]
+    (bob_token,) = seeded["player_tokens"]
 
     # Alice buys in 200 cash
-    alice_req = await request_service.create_request(
-        game_id=game_id, player_token=manager_token,
-        request_type=RequestType.CASH, amount=200,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(alice_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, manager_token, RequestType.CASH, 200, manager_token=manager_token)
 
     # Bob buys in 100 cash
-    bob_cash_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CASH, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_cash_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CASH, 100, manager_token=manager_token)
 
     # Bob buys in 100 credit
-    bob_credit_req = await request_service.create_request(
-        game_id=game_id, player_token=bob_token,
-        request_type=RequestType.CREDIT, amount=100,
-    )
-    await request_service.approve_request(
-        game_id=game_id, request_id=str(bob_credit_req.id),
-        manager_token=manager_token,
-    )
+    await approved_buy_in(game_id, bob_token, RequestType.CREDIT, 100, manager_token=manager_token)
 
     # Start settling
     await settlement_service.start_settling(game_id)
@@ -119,6 +42,52 @@ async def settling_game(game_service, request_service, settlement_service):
     }
 
 
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+# (player, chip_count, preferred_cash, preferred_credit, expected player fields)
+SUBMIT_AUTO_VALIDATE_CASES = [
+    # Alice is cash-only: fast path straight to DONE with all chips as cash.
+    pytest.param(
+        "manager_token", 250, 250, 0,
+        {
+            "checkout_status": CheckoutStatus.DONE,
+            "checked_out": True,
+            "validated_chip_count": 250,
+            "distribution": {"cash": 250, "credit_from": []},
+        },
+        id="cash_only_goes_straight_to_done",
+    ),
+    # Bob has 100 credit: the first 100 chips repay it.
+    pytest.param(
+        "bob_token", 200, 100, 0,
+        {
+            "checkout_status": CheckoutStatus.CREDIT_DEDUCTED,
+            "validated_chip_count": 200,
+            "credit_repaid": 100,
+            "chips_after_credit": 100,
+        },
+        id="credit_player_goes_to_credit_deducted",
+    ),
+    # Bob (100 cash + 100 credit) returning 200 chips:
+    # P/L = 200 - 200 = 0, credit_repaid = min(200, 100) = 100,
+    # chips_after_credit = 200 - 100 = 100, credit_owed = 0.
+    pytest.param(
+        "bob_token", 200, 100, 100,
+        {
+            "checkout_status": CheckoutStatus.CREDIT_DEDUCTED,
+            "validated_chip_count": 200,
+            "profit_loss": 0,
+            "credit_repaid": 100,
+            "chips_after_credit": 100,
+            "credits_owed": 0,
+        },
+        id="credit_math",
+    ),
+]
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -157,7 +126,6 @@ class TestSubmitChips:
         # Lock the player
         await player_dal.update_by_token(game_id, bob_token, {"input_locked": True})
 
-        from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
             await settlement_service.submit_chips(
                 game_id=game_id,
@@ -184,7 +152,6 @@ class TestSubmitChips:
             preferred_credit=100,
         )
 
-        from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
             await settlement_service.submit_chips(
                 game_id=game_id,
@@ -198,47 +165,28 @@ class TestSubmitChips:
 
 class TestSubmitAutoValidates:
 
-    async def test_cash_only_submit_goes_straight_to_done(
-        self, settlement_service, player_dal, game_dal, settling_game
-    ):
-        """Cash-only player submitting chips should auto-validate to DONE."""
-        game_id = settling_game["game_id"]
-        manager_token = settling_game["manager_token"]
-
-        await settlement_service.submit_chips(
-            game_id=game_id,
-            player_token=manager_token,
-            chip_count=250,
-            preferred_cash=250,
-            preferred_credit=0,
-        )
-
-        player = await player_dal.get_by_token(game_id, manager_token)
-        assert player.checkout_status == CheckoutStatus.DONE
-        assert player.checked_out is True
-        assert player.validated_chip_count == 250
-        assert player.distribution == {"cash": 250, "credit_from": []}
-
-    async def test_credit_player_submit_goes_to_credit_deducted(
-        self, settlement_service, player_dal, settling_game
+    @pytest.mark.parametrize(
+        "player_key,chip_count,preferred_cash,preferred_credit,expected",
+        SUBMIT_AUTO_VALIDATE_CASES,
+    )
+    async def test_submit_auto_validates(
+        self, settlement_service, player_dal, settling_game,
+        player_key, chip_count, preferred_cash, preferred_credit, expected,
     ):
-        """Player with credit submitting chips should auto-validate to CREDIT_DEDUCTED."""
+        """Submitting chips auto-validates to the status and math in the table."""
         game_id = settling_game["game_id"]
-        bob_token = settling_game["bob_token"]
+        player_token = settling_game[player_key]
 
         await settlement_service.submit_chips(
             game_id=game_id,
-            player_token=bob_token,
-            chip_count=200,
-            preferred_cash=100,
-            preferred_credit=0,
+            player_token=player_token,
+            chip_count=chip_count,
+            preferred_cash=preferred_cash,
+            preferred_credit=preferred_credit,
         )
 
-        player = await player_dal.get_by_token(game_id, bob_token)
-        assert player.checkout_status == CheckoutStatus.CREDIT_DEDUCTED
-        assert player.validated_chip_count == 200
-        assert player.credit_repaid == 100
-        assert player.chips_after_credit == 100
+        player = await player_dal.get_by_token(game_id, player_token)
+        assert {field: getattr(player, field) for field in expected} == expected
 
     async def test_all_players_done_updates_settlement_state(
         self, settlement_service, player_dal, game_dal, settling_game
@@ -290,37 +238,6 @@ class TestSubmitAutoValidates:
         assert result["status"] == "CLOSED"
 
 
-class TestValidateChips:
-
-    async def test_submit_auto_validates_credit_math(
-        self, settlement_service, player_dal, settling_game
-    ):
-        """Submit auto-validates: correct math for Bob (100 cash + 100 credit, returning 200 chips)."""
-        game_id = settling_game["game_id"]
-        bob_token = settling_game["bob_token"]
-
-        # Bob submits 200 chips — auto-validates
-        await settlement_service.submit_chips(
-            game_id=game_id,
-            player_token=bob_token,
-            chip_count=200,
-            preferred_cash=100,
-            preferred_credit=100,
-        )
-
-        player = await player_dal.get_by_token(game_id, bob_token)
-        assert player.checkout_status == CheckoutStatus.CREDIT_DEDUCTED
-        assert player.validated_chip_count == 200
-        # P/L = 200 - (100 + 100) = 0
-        assert player.profit_loss == 0
-        # credit_repaid = min(200, 100) = 100
-        assert player.credit_repaid == 100
-        # chips_after_credit = max(0, 200 - 100) = 100
-        assert player.chips_after_credit == 100
-        # credit_owed = max(0, 100 - 200) = 0
-        assert player.credits_owed == 0
-
-
 class TestRejectChips:
 
     async def test_manager_rejects_after_auto_validate(
@@ -4,70 +4,6 @@ Tests the full HTTP stack using HTTPX AsyncClient with the FastAPI app
 and mongomock-motor (no real MongoDB required).
 """
 
-import os
-
-os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests-only")
-
-import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from mongomock_motor import AsyncMongoMockClient
-
-from app.dal import database as db_module
-from app.auth import dependencies as auth_deps_module
-from app.routes import games as games_route_module
-from app.routes import chip_requests as chip_requests_route_module
-from app.routes import notifications as notifications_route_module
-from app.routes import settlement as settlement_route_module
-
-
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest_asyncio.fixture
-async def mock_db():
-    """Provide an in-memory mock MongoDB database and patch all get_database refs."""
-    client = AsyncMongoMockClient()
-    db = client["chipmate_test"]
-
-    getter = lambda: db
-    originals = {
-        "db": db_module.get_database,
-        "auth": auth_deps_module.get_database,
-        "games": games_route_module.get_database,
-        "requests": chip_requests_route_module.get_database,
-        "notifications": notifications_route_module.get_database,
-        "settlement": settlement_route_module.get_database,
-    }
-
-    db_module.get_database = getter
-    auth_deps_module.get_database = getter
-    games_route_module.get_database = getter
-    chip_requests_route_module.get_database = getter
-    notifications_route_module.get_database = getter
-    settlement_route_module.get_database = getter
-
-    yield db
-
-    db_module.get_database = originals["db"]
-    auth_deps_module.get_database = originals["auth"]
-    games_route_module.get_database = originals["games"]
-    chip_requests_route_module.get_database = originals["requests"]
-    notifications_route_module.get_database = originals["notifications"]
-    settlement_route_module.get_database = originals["settlement"]
-    client.close()
-
-
-@pytest_asyncio.fixture
-async def test_client(mock_db):
-    """Async HTTP client wired to the FastAPI app with mocked db."""
-    from app.main import app
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -110,7 +46,6 @@ async def _create_and_approve_request(test_client, game_id, player_token, manage
 
 class TestStartSettling:
 
-    @pytest.mark.asyncio
     async def test_start_settling_returns_200(self, test_client):
         game = await _create_game(test_client)
         game_id = game["game_id"]
@@ -133,7 +68,6 @@ class TestStartSettling:
         assert "cash_pool" in data
         assert "player_count" in data
 
-    @pytest.mark.asyncio
     async def test_start_settling_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -141,7 +75,6 @@ class TestStartSettling:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_start_settling_non_manager_returns_403(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -158,7 +91,6 @@ class TestStartSettling:
 
 class TestSubmitChips:
 
-    @pytest.mark.asyncio
     async def test_submit_chips_returns_submitted(self, test_client):
         game = await _create_game(test_client)
         game_id = game["game_id"]
@@ -183,7 +115,6 @@ class TestSubmitChips:
         assert resp.status_code == 200
         assert resp.json()["status"] == "submitted"
 
-    @pytest.mark.asyncio
     async def test_submit_chips_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -199,7 +130,6 @@ class TestSubmitChips:
 
 class TestGetPool:
 
-    @pytest.mark.asyncio
     async def test_get_pool_returns_state(self, test_client):
         game = await _create_game(test_client)
         game_id = game["game_id"]
@@ -215,7 +145,6 @@ class TestGetPool:
         assert "credit_pool" in data
         assert "settlement_state" in data
 
-    @pytest.mark.asyncio
     async def test_get_pool_requires_manager(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")
@@ -232,7 +161,6 @@ class TestGetPool:
 
 class TestCloseGame:
 
-    @pytest.mark.asyncio
     async def test_close_without_auth_returns_401(self, test_client):
         game = await _create_game(test_client)
         resp = await test_client.post(
@@ -240,7 +168,6 @@ class TestCloseGame:
         )
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_close_non_manager_returns_403(self, test_client):
         game = await _create_game(test_client)
         bob = await _join_game(test_client, game["game_id"], "Bob")